@@ -0,0 +1,318 @@
+"""Offline benchmark for the bot's command handlers.
+
+Runs every registered handler against a local stub Bot API and a stub NewsAPI
+server (no network, no real token needed) and reports p50/p95/p99 latency,
+throughput and allocations per handler.
+
+    python benchmark.py --iterations 300 --output bench.json
+    python benchmark.py --compare bench.json   # exit code 1 on regressions
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# --- Stub Servers ---
+
+STUB_ARTICLES = 20
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.respond()
+
+    def do_POST(self):
+        self.respond()
+
+    def respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        url = urlparse(self.path)
+        if url.path.startswith("/news/"):
+            payload = stub_news(parse_qs(url.query))
+        else:
+            payload = {"ok": True, "result": stub_bot_result(url.path.rsplit("/", 1)[-1])}
+
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def stub_news(query):
+    topic = query.get("q", ["startup"])[0]
+    page_size = int(query.get("pageSize", ["5"])[0])
+    articles = [
+        {
+            "source": {"id": None, "name": "Stub News"},
+            "title": f"{topic.title()} story #{i}: founders_raise *seed* [round]",
+            "description": f"Synthetic article {i} about {topic}.",
+            "url": f"https://news.example.com/{topic.replace(' ', '-')}/{i}?utm_source=bench",
+            "publishedAt": f"2026-01-{i % 28 + 1:02d}T12:00:00Z",
+        }
+        for i in range(min(page_size, STUB_ARTICLES))
+    ]
+    return {"status": "ok", "totalResults": len(articles), "articles": articles}
+
+
+def stub_bot_result(method):
+    if method == "getMe":
+        return {
+            "id": 1,
+            "is_bot": True,
+            "first_name": "Bench",
+            "username": "bench_bot",
+            "can_join_groups": True,
+            "can_read_all_group_messages": False,
+            "supports_inline_queries": True,
+        }
+    if method in ("sendMessage", "editMessageText", "sendDocument"):
+        return {
+            "message_id": 1,
+            "date": int(time.time()),
+            "chat": {"id": 1, "type": "private"},
+            "text": "ok",
+        }
+    return True
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# --- Benchmark Cases ---
+
+my_bot = Update = CommandHandler = None
+
+
+def load_bot():
+    global my_bot, Update, CommandHandler
+    import my_bot
+    from telegram import Update
+    from telegram.ext import CommandHandler
+
+
+def make_update(bot, update_id, chat_id, text):
+    message = {
+        "message_id": update_id,
+        "date": int(time.time()),
+        "chat": {"id": chat_id, "type": "private", "first_name": "Bench"},
+        "from": {"id": chat_id, "is_bot": False, "first_name": "Bench", "language_code": "en"},
+        "text": text,
+    }
+    if text.startswith("/"):
+        message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}]
+    return Update.de_json({"update_id": update_id, "message": message}, bot)
+
+
+def make_callback_update(bot, update_id, chat_id, data):
+    user = {"id": chat_id, "is_bot": False, "first_name": "Bench", "language_code": "en"}
+    callback_query = {
+        "id": str(update_id),
+        "from": user,
+        "chat_instance": str(chat_id),
+        "data": data,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private", "first_name": "Bench"},
+            "from": {"id": 1, "is_bot": True, "first_name": "Bench"},
+            "text": "news",
+        },
+    }
+    return Update.de_json({"update_id": update_id, "callback_query": callback_query}, bot)
+
+
+def make_inline_update(bot, update_id, user_id, query):
+    user = {"id": user_id, "is_bot": False, "first_name": "Bench", "language_code": "en"}
+    inline_query = {"id": str(update_id), "from": user, "query": query, "offset": ""}
+    return Update.de_json({"update_id": update_id, "inline_query": inline_query}, bot)
+
+
+def news_page_case(i):
+    set_id = my_bot.RESULT_SETS.register("funding", my_bot.NEWS_CACHE.peek("funding") or [])
+    return CallbackData(f"news:{set_id}:{i % 3}")
+
+
+class CallbackData(str):
+    pass
+
+
+class InlineData(str):
+    pass
+
+
+def build_cases(application):
+    # One case per registered command (commands taking arguments get a typical one),
+    # plus the free-text and unknown-command fallbacks.
+    arguments = {"news": "funding", "quote": "", "search": "failure"}
+    cases = {}
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            if isinstance(handler, CommandHandler):
+                for command in sorted(handler.commands):
+                    text = f"/{command} {arguments.get(command, '')}".strip()
+                    cases[command] = lambda i, text=text: text
+    cases["news (uncached)"] = lambda i: f"/news benchtopic{i}"
+    cases["quote <author>"] = lambda i: "/quote drucker"
+    cases["handle_message (greeting)"] = lambda i: "hello there"
+    cases["handle_message (no match)"] = lambda i: "this is just some group chatter"
+    cases["unknown"] = lambda i: "/doesnotexist"
+    cases["news page (callback)"] = news_page_case
+    cases["inline (news, cached)"] = lambda i: InlineData("funding")
+    cases["inline (quote)"] = lambda i: InlineData("quote drucker")
+    return cases
+
+
+async def run_case(application, make_text, iterations, warmup):
+    bot = application.bot
+    counter = iter(range(1, 10**9))
+
+    async def once():
+        i = next(counter)
+        # A fresh chat per call so per-chat send limits don't dominate the numbers
+        text = make_text(i)
+        if isinstance(text, CallbackData):
+            update = make_callback_update(bot, i, 10_000 + i, text)
+        elif isinstance(text, InlineData):
+            update = make_inline_update(bot, i, 10_000 + i, text)
+        else:
+            update = make_update(bot, i, 10_000 + i, text)
+        await application.process_update(update)
+
+    for _ in range(warmup):
+        await once()
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        await once()
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    alloc_runs = max(1, iterations // 10)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(alloc_runs):
+        await once()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "iterations": iterations,
+        "p50_ms": round(quantiles[49] * 1000, 3),
+        "p95_ms": round(quantiles[94] * 1000, 3),
+        "p99_ms": round(quantiles[98] * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "throughput_per_s": round(iterations / elapsed, 1),
+        "alloc_peak_kib": round((peak - before) / 1024, 1),
+        "alloc_retained_kib_per_call": round((current - before) / 1024 / alloc_runs, 2),
+    }
+
+
+async def run_benchmarks(iterations, warmup, only):
+    application = my_bot.build_application()
+    async with application:
+        await my_bot.post_init(application)
+        results = {}
+        for name, make_text in build_cases(application).items():
+            if only and name not in only:
+                continue
+            results[name] = await run_case(application, make_text, iterations, warmup)
+            r = results[name]
+            print(f"{name:<28} p50 {r['p50_ms']:>8.3f} ms  p95 {r['p95_ms']:>8.3f} ms  "
+                  f"p99 {r['p99_ms']:>8.3f} ms  {r['throughput_per_s']:>8.1f}/s  "
+                  f"peak {r['alloc_peak_kib']:>7.1f} KiB")
+    await my_bot.post_shutdown(application)
+    return results
+
+# --- Reporting ---
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if old[metric] and result[metric] > old[metric] * (1 + threshold):
+                regressions.append(f"{name}: {metric} {old[metric]} -> {result[metric]}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the bot's handlers offline.")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--only", action="append", help="Run only this case (repeatable)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative slowdown before a metric counts as a regression")
+    args = parser.parse_args()
+
+    # The bot reads its configuration at import time, so point it at the stubs first
+    stub = start_stub_server()
+    stub_url = f"http://127.0.0.1:{stub.server_address[1]}"
+    os.environ.setdefault("TOKEN", "123456:BENCHMARK")
+    os.environ.setdefault("NEWS_API_KEY", "benchmark")
+    os.environ["TELEGRAM_API_URL"] = f"{stub_url}/bot"
+    os.environ["NEWS_API_BASE_URL"] = f"{stub_url}/news/v2"
+    os.environ.setdefault("SEND_GLOBAL_RATE", "1000000")
+    os.environ.setdefault("NEWS_API_DAILY_QUOTA", "1000000")
+    os.environ.setdefault("USER_DB_FILE", os.path.join(tempfile.mkdtemp(prefix="bot-bench-"), "bot.db"))
+    load_bot()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    results = asyncio.run(run_benchmarks(args.iterations, args.warmup, args.only))
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
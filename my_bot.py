@@ -1,854 +1,3333 @@
+import time
+
+STARTUP_STARTED = time.perf_counter()  # reference point for the startup timing report
+
+import asyncio
+import atexit
+import bisect
+import contextlib
+import contextvars
+import datetime
+import email.utils
+import hashlib
+import functools
+import heapq
+import hmac
+import html
+import itertools
+import json
 import logging
+import logging.handlers
+import math
 import os
 import httpx
+import queue
 import random
+import re
+import secrets
+import signal
+import sqlite3
+import string
+import sys
 import threading
-from flask import Flask
-from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ApplicationHandlerStop
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from collections import OrderedDict, deque, namedtuple
+from telegram import BotCommand, Update, ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardButton, InlineKeyboardMarkup, InlineQueryResultArticle, InputTextMessageContent
+from telegram.error import BadRequest, Forbidden, RetryAfter
+from telegram.ext import Application, BaseRateLimiter, BaseUpdateProcessor, CallbackQueryHandler, CommandHandler, InlineQueryHandler, MessageHandler, TypeHandler, filters, ContextTypes, ApplicationHandlerStop
 
 # --- Web Server Setup (for Render's Free Tier) ---
 
-app = Flask(__name__)
+# Flask is only needed for the health server in polling mode, so it is imported on first use
+def create_flask_app():
+    from flask import Flask, Response
+
+    app = Flask(__name__)
 
-@app.route('/')
-def hello():
-    return "Bot is alive!"
+    @app.route('/')
+    def hello():
+        return "Bot is alive!"
+
+    @app.route('/metrics')
+    def metrics():
+        return Response(METRICS.render(), mimetype=METRICS_CONTENT_TYPE)
+
+    return app
 
 def run_flask_app():
     port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port)
+    create_flask_app().run(host='0.0.0.0', port=port)
 
 # --- Telegram Bot Configuration ---
 
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+# IMPORTANT: Replace these with env vars in production
+TOKEN = os.getenv("TOKEN")
+NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org/bot")
+
+# Update ingestion: "polling" (default) or "webhook"
+BOT_MODE = os.getenv("BOT_MODE", "polling").lower()
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")  # public base URL, e.g. https://openstart-bot.onrender.com
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/telegram")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+WEBHOOK_MAX_INFLIGHT = int(os.getenv("WEBHOOK_MAX_INFLIGHT", 100))
+WEBHOOK_MAX_CONNECTIONS = int(os.getenv("WEBHOOK_MAX_CONNECTIONS", 40))
+
+# Update processing: different chats run in parallel, each chat's updates stay in order
+CONCURRENT_UPDATES = int(os.getenv("CONCURRENT_UPDATES", 32))
+MAX_PENDING_UPDATES = int(os.getenv("MAX_PENDING_UPDATES", 1024))
+
+# Backlog policy (e.g. after downtime): messages older than UPDATE_MAX_AGE seconds are
+# dropped (0 keeps everything) and ones older than UPDATE_STALE_AGE yield to fresh ones
+UPDATE_MAX_AGE = float(os.getenv("UPDATE_MAX_AGE", 300))
+UPDATE_STALE_AGE = float(os.getenv("UPDATE_STALE_AGE", 15))
+
+# Outbound Bot API limits (Telegram allows ~30 msg/s overall, ~1 msg/s per chat, 20 msg/min per group)
+SEND_GLOBAL_RATE = float(os.getenv("SEND_GLOBAL_RATE", 30))
+SEND_CHAT_RATE = float(os.getenv("SEND_CHAT_RATE", 1))
+SEND_CHAT_BURST = int(os.getenv("SEND_CHAT_BURST", 3))
+SEND_GROUP_RATE_PER_MIN = float(os.getenv("SEND_GROUP_RATE_PER_MIN", 20))
+SEND_MAX_RETRIES = int(os.getenv("SEND_MAX_RETRIES", 3))
+SEND_MAX_CHAT_BUCKETS = int(os.getenv("SEND_MAX_CHAT_BUCKETS", 10000))
+
+# Pass as `rate_limit_args` to Bot methods; lower values are sent first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 10
+
+# User store: SQLite database; writes are buffered and flushed in batches off the event loop
+USER_DB_FILE = os.getenv("USER_DB_FILE", "bot.db")
+USER_STORE_FLUSH_INTERVAL = float(os.getenv("USER_STORE_FLUSH_INTERVAL", 2))
+USER_STORE_BATCH_SIZE = int(os.getenv("USER_STORE_BATCH_SIZE", 500))
+
+# In-chat /apply and /feedback forms: answers stay in memory until the form is submitted.
+# Sessions silent for FORM_SESSION_TTL seconds are dropped, and at most FORM_MAX_SESSIONS are
+# kept (the least recently active go first). With a shared state backend, sessions are kept
+# there so every worker sees them, and only the TTL applies.
+FORM_SESSION_TTL = float(os.getenv("FORM_SESSION_TTL", 1800))
+FORM_MAX_SESSIONS = int(os.getenv("FORM_MAX_SESSIONS", 10000))
+FORM_ANSWER_MAX_CHARS = int(os.getenv("FORM_ANSWER_MAX_CHARS", 1500))
+
+# Broadcasts (admin-only): comma-separated Telegram user ids allowed to run /broadcast
+ADMIN_IDS = frozenset(int(user_id) for user_id in os.getenv("ADMIN_IDS", "").split(",") if user_id.strip())
+BROADCAST_STATE_FILE = os.getenv("BROADCAST_STATE_FILE", "broadcast_state.json")
+BROADCAST_BATCH_SIZE = int(os.getenv("BROADCAST_BATCH_SIZE", 30))
+BROADCAST_REPORT_INTERVAL = float(os.getenv("BROADCAST_REPORT_INTERVAL", 5))
+
+# Shared NewsAPI client settings (one pooled client lives for the whole process)
+NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2")
+NEWS_HTTP_MAX_CONNECTIONS = int(os.getenv("NEWS_HTTP_MAX_CONNECTIONS", 20))
+NEWS_HTTP_MAX_KEEPALIVE = int(os.getenv("NEWS_HTTP_MAX_KEEPALIVE", 10))
+NEWS_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("NEWS_HTTP_KEEPALIVE_EXPIRY", 30))
+NEWS_HTTP_CONNECT_TIMEOUT = float(os.getenv("NEWS_HTTP_CONNECT_TIMEOUT", 5))
+NEWS_HTTP_READ_TIMEOUT = float(os.getenv("NEWS_HTTP_READ_TIMEOUT", 10))
+NEWS_HTTP2 = os.getenv("NEWS_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# News cache: fresh for NEWS_CACHE_TTL seconds, then served stale (while refreshing) for NEWS_CACHE_STALE_TTL more
+NEWS_CACHE_TTL = float(os.getenv("NEWS_CACHE_TTL", 300))
+NEWS_CACHE_STALE_TTL = float(os.getenv("NEWS_CACHE_STALE_TTL", 900))
+NEWS_CACHE_MAX_ENTRIES = int(os.getenv("NEWS_CACHE_MAX_ENTRIES", 256))
+NEWS_CACHE_PARTIAL_TTL = float(os.getenv("NEWS_CACHE_PARTIAL_TTL", 60))  # results fetched while NewsAPI was failing
+
+# Free-text intents: optional JSON file mapping intent name -> list of trigger phrases
+INTENTS_FILE = os.getenv("INTENTS_FILE")
+
+# /news paging: one upstream fetch of NEWS_FETCH_PAGE_SIZE articles, shown NEWS_PAGE_SIZE at a time
+NEWS_FETCH_PAGE_SIZE = int(os.getenv("NEWS_FETCH_PAGE_SIZE", 25))
+NEWS_PAGE_SIZE = int(os.getenv("NEWS_PAGE_SIZE", 5))
+NEWS_RESULT_SET_TTL = float(os.getenv("NEWS_RESULT_SET_TTL", 1800))
+NEWS_RESULT_SET_MAX = int(os.getenv("NEWS_RESULT_SET_MAX", 2048))
+
+# Extra news sources: comma-separated RSS/Atom feed URLs or local file paths, each with its own time budget
+NEWS_FEEDS = [feed.strip() for feed in os.getenv("NEWS_FEEDS", "").split(",") if feed.strip()]
+NEWS_FEED_TIMEOUT = float(os.getenv("NEWS_FEED_TIMEOUT", 3))
+
+# NewsAPI resilience: overall deadline per fetch, jittered retries, optional hedging and a circuit breaker
+NEWS_FETCH_DEADLINE = float(os.getenv("NEWS_FETCH_DEADLINE", 8))
+NEWS_FETCH_RETRIES = int(os.getenv("NEWS_FETCH_RETRIES", 2))
+NEWS_FETCH_BACKOFF = float(os.getenv("NEWS_FETCH_BACKOFF", 0.3))
+NEWS_HEDGE_DELAY = float(os.getenv("NEWS_HEDGE_DELAY", 0))  # seconds before a hedged request; 0 disables
+NEWS_BREAKER_THRESHOLD = int(os.getenv("NEWS_BREAKER_THRESHOLD", 5))
+NEWS_BREAKER_COOLDOWN = float(os.getenv("NEWS_BREAKER_COOLDOWN", 30))
+
+# Popularity-driven prefetching and daily digests (need python-telegram-bot[job-queue])
+NEWS_PREFETCH_INTERVAL = float(os.getenv("NEWS_PREFETCH_INTERVAL", 240))
+NEWS_PREFETCH_TOP_N = int(os.getenv("NEWS_PREFETCH_TOP_N", 10))
+TOPIC_POPULARITY_HALF_LIFE = float(os.getenv("TOPIC_POPULARITY_HALF_LIFE", 6 * 3600))
+TOPIC_POPULARITY_MAX_TOPICS = int(os.getenv("TOPIC_POPULARITY_MAX_TOPICS", 1000))
+DIGEST_TIME = os.getenv("DIGEST_TIME", "08:00")  # UTC, HH:MM
+DIGEST_TOPICS = int(os.getenv("DIGEST_TOPICS", 3))
+
+# Quote corpus: one "text - author" quote per line
+QUOTES_FILE = os.getenv("QUOTES_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "quotes.txt"))
+QUOTE_BAGS_MAX_USERS = int(os.getenv("QUOTE_BAGS_MAX_USERS", 5000))
+
+# /search: how often content files are checked for changes, and how many hits to show
+CONTENT_WATCH_INTERVAL = float(os.getenv("CONTENT_WATCH_INTERVAL", 30))
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", 5))
+
+# Inline mode (@bot funding, @bot quote drucker)
+INLINE_MAX_RESULTS = int(os.getenv("INLINE_MAX_RESULTS", 10))
+INLINE_DEBOUNCE = float(os.getenv("INLINE_DEBOUNCE", 0.35))  # wait for typing to pause before fetching
+INLINE_FETCH_TIMEOUT = float(os.getenv("INLINE_FETCH_TIMEOUT", 4))
+INLINE_QUOTE_CACHE_TIME = int(os.getenv("INLINE_QUOTE_CACHE_TIME", 3600))
+
+# NewsAPI daily quota (calls per UTC day) and how many calls to keep back for users
+NEWS_API_DAILY_QUOTA = int(os.getenv("NEWS_API_DAILY_QUOTA", 100))
+NEWS_API_QUOTA_RESERVE = int(os.getenv("NEWS_API_QUOTA_RESERVE", 20))
+
+# Per-user limit on requests that may go upstream (uncached /news, inline news)
+USER_RATE_PER_MIN = float(os.getenv("USER_RATE_PER_MIN", 6))
+USER_RATE_BURST = int(os.getenv("USER_RATE_BURST", 5))
+USER_RATE_MAX_USERS = int(os.getenv("USER_RATE_MAX_USERS", 10000))
+USER_RATE_IDLE = float(os.getenv("USER_RATE_IDLE", 600))
+
+# Shared state: memory:// (single process) or redis://[:password@]host:port/db to let
+# several workers share the news cache, result sets, quota and rate limits
+STATE_BACKEND_URL = os.getenv("STATE_BACKEND_URL", "memory://")
+STATE_KEY_PREFIX = os.getenv("STATE_KEY_PREFIX", "openstart:")
+STATE_TIMEOUT = float(os.getenv("STATE_TIMEOUT", 0.5))
+STATE_MEMORY_MAX_KEYS = int(os.getenv("STATE_MEMORY_MAX_KEYS", 100000))
+
+# Logging: records are queued and written as JSON lines (or text) by a background thread
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()  # json or text
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", 0.1))  # share of noisy INFO records kept
+LOG_SAMPLED_LOGGERS = tuple(name.strip() for name in os.getenv("LOG_SAMPLED_LOGGERS", "httpx,apscheduler").split(",") if name.strip())
+
+# --- Logging ---
+
+# Id of the update being handled, attached to every record logged while handling it
+CORRELATION_ID = contextvars.ContextVar("correlation_id", default=None)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.update_id is not None:
+            entry["update_id"] = record.update_id
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# Runs in the caller before a record is queued: tags it with the current update id and
+# keeps only a sample of INFO-and-below records from chatty loggers (httpx logs every
+# request). Warnings and errors always go through.
+class LogSampler(logging.Filter):
+    def __init__(self, rate, loggers):
+        super().__init__()
+        self.rate = rate
+        self.loggers = loggers
+        self.sampled_out = 0
+
+    def filter(self, record):
+        record.update_id = CORRELATION_ID.get()
+        if record.levelno < logging.WARNING and record.name.startswith(self.loggers) and random.random() >= self.rate:
+            self.sampled_out += 1
+            return False
+        return True
+
+
+# Hands records to the writer thread without blocking. Records are passed on unformatted,
+# so the message is only built on the writer thread; when the queue is full the record
+# is dropped and counted rather than making the event loop wait.
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging():
+    output = logging.StreamHandler()
+    if LOG_FORMAT == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(update_id)s] %(message)s"))
+
+    handler = BoundedQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    handler.addFilter(LogSampler(LOG_SAMPLE_RATE, LOG_SAMPLED_LOGGERS))
+    logging.basicConfig(level=LOG_LEVEL, handlers=[handler])
+
+    listener = logging.handlers.QueueListener(handler.queue, output)
+    listener.start()
+    atexit.register(listener.stop)  # drains what's queued on exit
+    return handler
+
+
+LOG_HANDLER = configure_logging()
+
+# --- Metrics ---
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", 0.5))
+STARTUP_TIMINGS = {}  # phase -> seconds: import, init, ready, first_update
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name, labels=""):
+        lines = []
+        cumulative = 0
+        sep = "," if labels else ""
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.sum}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+# Process-wide counters rendered in the Prometheus text format on /metrics. Values that
+# live elsewhere (cache counters, update backlog, send queue) are read at scrape time.
+class Metrics:
+    def __init__(self):
+        self.application = None
+        self.command_latency = {}  # command -> Histogram
+        self.command_errors = {}  # command -> count
+        self.news_api_latency = Histogram()
+        self.news_api_errors = {}  # reason -> count
+        self.source_latency = {}  # news source -> Histogram
+        self.source_errors = {}  # news source -> count
+        self.loop_lag = Histogram((0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0))
+        self.loop_lag_last = 0.0
+
+    def observe_command(self, command, seconds, failed=False):
+        histogram = self.command_latency.get(command)
+        if histogram is None:
+            histogram = self.command_latency[command] = Histogram()
+        histogram.observe(seconds)
+        if failed:
+            self.command_errors[command] = self.command_errors.get(command, 0) + 1
+
+    def news_api_error(self, reason):
+        self.news_api_errors[reason] = self.news_api_errors.get(reason, 0) + 1
+
+    def observe_source(self, source, seconds):
+        histogram = self.source_latency.get(source)
+        if histogram is None:
+            histogram = self.source_latency[source] = Histogram()
+        histogram.observe(seconds)
+
+    def source_error(self, source):
+        self.source_errors[source] = self.source_errors.get(source, 0) + 1
+
+    def render(self):
+        lines = ["# TYPE bot_command_latency_seconds histogram"]
+        for command, histogram in list(self.command_latency.items()):
+            lines += histogram.render("bot_command_latency_seconds", f'command="{command}"')
+        lines.append("# TYPE bot_command_errors_total counter")
+        for command, count in list(self.command_errors.items()):
+            lines.append(f'bot_command_errors_total{{command="{command}"}} {count}')
+
+        lines.append("# TYPE bot_newsapi_latency_seconds histogram")
+        lines += self.news_api_latency.render("bot_newsapi_latency_seconds")
+        lines.append("# TYPE bot_newsapi_errors_total counter")
+        for reason, count in list(self.news_api_errors.items()):
+            lines.append(f'bot_newsapi_errors_total{{reason="{reason}"}} {count}')
+
+        cache = NEWS_CACHE
+        lookups = cache.hits + cache.stale_hits + cache.misses
+        lines.append("# TYPE bot_news_source_latency_seconds histogram")
+        for source, histogram in list(self.source_latency.items()):
+            lines += histogram.render("bot_news_source_latency_seconds", f'source="{source}"')
+        lines.append("# TYPE bot_news_source_errors_total counter")
+        for source, count in list(self.source_errors.items()):
+            lines.append(f'bot_news_source_errors_total{{source="{source}"}} {count}')
+
+        lines.append("# TYPE bot_newsapi_quota_remaining gauge")
+        lines.append(f"bot_newsapi_quota_remaining {NEWS_QUOTA.remaining}")
+        lines.append("# TYPE bot_newsapi_quota_used gauge")
+        lines.append(f"bot_newsapi_quota_used {NEWS_QUOTA.used}")
+        lines.append("# TYPE bot_newsapi_quota_rejected_total counter")
+        lines.append(f"bot_newsapi_quota_rejected_total {NEWS_QUOTA.rejected}")
+        lines.append("# TYPE bot_user_rate_limited_total counter")
+        lines.append(f"bot_user_rate_limited_total {USER_LIMITER.limited}")
+        lines.append("# TYPE bot_user_rate_limiter_entries gauge")
+        lines.append(f"bot_user_rate_limiter_entries {len(USER_LIMITER)}")
+
+        lines.append("# TYPE bot_newsapi_circuit_open gauge")
+        lines.append(f"bot_newsapi_circuit_open {int(NEWS_BREAKER.is_open)}")
+
+        lines.append("# TYPE bot_news_cache_lookups_total counter")
+        lines.append(f'bot_news_cache_lookups_total{{result="fresh"}} {cache.hits}')
+        lines.append(f'bot_news_cache_lookups_total{{result="stale"}} {cache.stale_hits}')
+        lines.append(f'bot_news_cache_lookups_total{{result="miss"}} {cache.misses}')
+        lines.append(f'bot_news_cache_lookups_total{{result="fallback"}} {cache.fallbacks}')
+        lines.append("# TYPE bot_news_cache_hit_ratio gauge")
+        lines.append(f"bot_news_cache_hit_ratio {(cache.hits + cache.stale_hits) / lookups if lookups else 0}")
+        lines.append("# TYPE bot_news_cache_entries gauge")
+        lines.append(f"bot_news_cache_entries {len(cache)}")
+
+        application = self.application
+        if application is not None:
+            processor = application.update_processor
+            if isinstance(processor, ChatLaneUpdateProcessor):
+                # PTB moves updates off its queue into tasks right away, so the real backlog
+                # is what the processor is still holding back
+                pending, running = processor.waiting, processor.running
+            else:
+                pending, running = application.update_queue.qsize(), processor.current_concurrent_updates
+            lines.append("# TYPE bot_pending_updates gauge")
+            lines.append(f"bot_pending_updates {pending}")
+            lines.append("# TYPE bot_updates_in_progress gauge")
+            lines.append(f"bot_updates_in_progress {running}")
+            if isinstance(processor, ChatLaneUpdateProcessor):
+                lines.append("# TYPE bot_updates_dropped_total counter")
+                lines.append(f'bot_updates_dropped_total{{reason="stale"}} {processor.dropped_stale}')
+                lines.append(f'bot_updates_dropped_total{{reason="coalesced"}} {processor.coalesced}')
+
+            scheduler = application.bot.rate_limiter
+            if isinstance(scheduler, SendScheduler):
+                lines.append("# TYPE bot_send_queue_depth gauge")
+                lines.append(f"bot_send_queue_depth {scheduler.queue_depth}")
+                lines.append("# TYPE bot_send_requests_total counter")
+                lines.append(f"bot_send_requests_total {scheduler.sent}")
+                lines.append("# TYPE bot_send_delay_seconds_total counter")
+                lines.append(f"bot_send_delay_seconds_total {scheduler.total_delay}")
+                lines.append("# TYPE bot_send_delay_max_seconds gauge")
+                lines.append(f"bot_send_delay_max_seconds {scheduler.max_delay}")
+                lines.append("# TYPE bot_send_retry_after_total counter")
+                lines.append(f"bot_send_retry_after_total {scheduler.retry_after_hits}")
+
+        lines.append("# TYPE bot_inline_queries_superseded_total counter")
+        lines.append(f"bot_inline_queries_superseded_total {INLINE_DEBOUNCER.superseded}")
+
+        lines.append("# TYPE bot_state_backend_errors_total counter")
+        lines.append(f"bot_state_backend_errors_total {STATE.errors}")
+
+        lines.append("# TYPE bot_render_cache_lookups_total counter")
+        lines.append(f'bot_render_cache_lookups_total{{result="hit"}} {NEWS_PAGES.hits}')
+        lines.append(f'bot_render_cache_lookups_total{{result="miss"}} {NEWS_PAGES.misses}')
+
+        lines.append("# TYPE bot_form_sessions_active gauge")
+        lines.append(f"bot_form_sessions_active {len(FORM_SESSIONS)}")
+        lines.append("# TYPE bot_form_sessions_dropped_total counter")
+        lines.append(f'bot_form_sessions_dropped_total{{reason="expired"}} {FORM_SESSIONS.expired}')
+        lines.append(f'bot_form_sessions_dropped_total{{reason="evicted"}} {FORM_SESSIONS.evicted}')
+        lines.append("# TYPE bot_form_submissions_total counter")
+        for form, count in list(FORM_SESSIONS.submitted.items()):
+            lines.append(f'bot_form_submissions_total{{form="{form}"}} {count}')
+
+        lines.append("# TYPE bot_user_store_pending_writes gauge")
+        lines.append(f"bot_user_store_pending_writes {USER_STORE.pending_writes}")
+        lines.append("# TYPE bot_user_store_flushes_total counter")
+        lines.append(f"bot_user_store_flushes_total {USER_STORE.flushes}")
+        lines.append("# TYPE bot_user_store_rows_written_total counter")
+        lines.append(f"bot_user_store_rows_written_total {USER_STORE.rows_written}")
+
+        lines.append("# TYPE bot_log_queue_depth gauge")
+        lines.append(f"bot_log_queue_depth {LOG_HANDLER.queue.qsize()}")
+        lines.append("# TYPE bot_log_records_dropped_total counter")
+        lines.append(f"bot_log_records_dropped_total {LOG_HANDLER.dropped}")
+        lines.append("# TYPE bot_log_records_sampled_out_total counter")
+        lines.append(f"bot_log_records_sampled_out_total {LOG_HANDLER.filters[0].sampled_out}")
+
+        lines.append("# TYPE bot_startup_seconds gauge")
+        for phase, seconds in list(STARTUP_TIMINGS.items()):
+            lines.append(f'bot_startup_seconds{{phase="{phase}"}} {seconds}')
+
+        lines.append("# TYPE bot_event_loop_lag_seconds histogram")
+        lines += self.loop_lag.render("bot_event_loop_lag_seconds")
+        lines.append("# TYPE bot_event_loop_lag_last_seconds gauge")
+        lines.append(f"bot_event_loop_lag_last_seconds {self.loop_lag_last}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+
+
+def instrument(callback):
+    command = callback.__name__
+
+    @functools.wraps(callback)
+    async def wrapper(update, context):
+        started = time.perf_counter()
+        failed = False
+        try:
+            return await callback(update, context)
+        except ApplicationHandlerStop:
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            METRICS.observe_command(command, time.perf_counter() - started, failed)
+
+    return wrapper
+
+
+async def monitor_loop_lag():
+    while True:
+        started = time.monotonic()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        lag = max(0.0, time.monotonic() - started - LOOP_LAG_INTERVAL)
+        METRICS.loop_lag.observe(lag)
+        METRICS.loop_lag_last = lag
+
+# --- Shared State ---
+
+# Default backend: plain process memory. Components only go through the backend for state
+# that must agree across workers (quota, rate limits); with `shared` False they keep the
+# rest (news cache, result sets, open forms) in their own in-process structures.
+class MemoryBackend:
+    shared = False
+
+    def __init__(self, max_keys):
+        self.max_keys = max_keys
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self.errors = 0
+
+    async def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry[1]
+
+    async def set(self, key, value, ttl):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_keys:
+            self._data.popitem(last=False)
+
+    async def incr(self, key, ttl):
+        # Increments a counter; `ttl` only applies when the counter is created
+        current = await self.get(key)
+        if current is None:
+            await self.set(key, 1, ttl)
+            return 1
+        self._data[key] = (self._data[key][0], current + 1)
+        return current + 1
+
+    async def delete(self, key):
+        self._data.pop(key, None)
+
+    async def close(self):
+        pass
+
+
+class RedisError(Exception):
+    pass
+
+
+def encode_redis_command(args):
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def read_redis_reply(reader):
+    line = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return RedisError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        return None if length < 0 else (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(payload)
+        return None if length < 0 else [await read_redis_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"Unexpected reply from state backend: {line!r}")
+
+
+# Minimal client for the Redis protocol (RESP2), so any compatible server (Redis, Valkey,
+# KeyDB or a local stand-in) can be used without an extra dependency. One connection;
+# commands are pipelined and replies handed back to callers in order. The connection is
+# opened on first use and reopened after it drops.
+class RedisBackend:
+    shared = True
+
+    def __init__(self, url, prefix, timeout):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.tls = parts.scheme == "rediss"
+        self.username = parts.username
+        self.password = parts.password
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.prefix = prefix
+        self.timeout = timeout
+        self._connect_lock = asyncio.Lock()
+        self._writer = None
+        self._reader_task = None
+        self._replies = deque()  # futures waiting for replies, in command order
+        self.errors = 0
+
+    async def _connect(self):
+        async with self._connect_lock:
+            if self._writer is not None:
+                return
+            reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.tls or None)
+            self._writer = writer
+            self._reader_task = asyncio.create_task(self._read_replies(reader, writer))
+            try:
+                if self.password:
+                    credentials = (self.username, self.password) if self.username else (self.password,)
+                    await self._send("AUTH", *credentials)
+                if self.db:
+                    await self._send("SELECT", self.db)
+            except BaseException:
+                self._reader_task.cancel()
+                raise
+
+    def _send(self, *args):
+        future = asyncio.get_running_loop().create_future()
+        self._replies.append(future)
+        self._writer.write(encode_redis_command(args))
+        return future
+
+    async def _read_replies(self, reader, writer):
+        error = ConnectionError("State backend connection closed")
+        try:
+            while True:
+                reply = await read_redis_reply(reader)
+                future = self._replies.popleft()
+                if future.done():
+                    continue  # the caller timed out
+                if isinstance(reply, RedisError):
+                    future.set_exception(reply)
+                else:
+                    future.set_result(reply)
+        except Exception as e:
+            error = ConnectionError(f"State backend connection lost: {e!r}")
+        finally:
+            if self._writer is writer:
+                self._writer = None
+            writer.close()
+            while self._replies:
+                future = self._replies.popleft()
+                if not future.done():
+                    future.set_exception(error)
+
+    async def execute(self, *args):
+        try:
+            if self._writer is None:
+                await asyncio.wait_for(self._connect(), self.timeout)
+            return await asyncio.wait_for(self._send(*args), self.timeout)
+        except Exception:
+            self.errors += 1
+            raise
+
+    async def get(self, key):
+        return await self.execute("GET", self.prefix + key)
+
+    async def set(self, key, value, ttl):
+        await self.execute("SET", self.prefix + key, value, "PX", max(1, int(ttl * 1000)))
+
+    async def incr(self, key, ttl):
+        count = await self.execute("INCR", self.prefix + key)
+        if count == 1:
+            await self.execute("PEXPIRE", self.prefix + key, max(1, int(ttl * 1000)))
+        return count
+
+    async def delete(self, key):
+        await self.execute("DEL", self.prefix + key)
+
+    async def close(self):
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+
+def open_state_backend(url):
+    scheme = urlsplit(url).scheme
+    if scheme == "memory":
+        return MemoryBackend(STATE_MEMORY_MAX_KEYS)
+    if scheme in ("redis", "rediss"):
+        return RedisBackend(url, STATE_KEY_PREFIX, STATE_TIMEOUT)
+    raise ValueError(f"Unsupported STATE_BACKEND_URL scheme: {scheme!r}")
+
+
+STATE = open_state_backend(STATE_BACKEND_URL)
+
+# --- News Cache ---
+
+def normalize_topic(topic):
+    return " ".join(topic.lower().split())
+
+
+# Results merged from the other sources while NewsAPI was failing: worth showing, but not
+# worth keeping over a complete result, or for a full TTL
+class PartialResult(list):
+    pass
+
+
+# TTL/LRU cache for news results. Concurrent misses for the same topic share one
+# upstream fetch, and expired entries are served stale while a refresh runs.
+class NewsCache:
+    def __init__(self, ttl, stale_ttl, max_entries, backend, partial_ttl):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.partial_ttl = partial_ttl
+        self.max_entries = max_entries
+        self.backend = backend
+        self._entries = OrderedDict()  # key -> (fetched_at, articles)
+        self._inflight = {}  # key -> asyncio.Task
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_fresh(self, key):
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def peek(self, key):
+        # Fresh or stale-but-servable result, without counting a lookup or fetching
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl + self.stale_ttl:
+            return None
+        return entry[1]
+
+    def expires_in(self, key):
+        entry = self._entries.get(key)
+        return 0.0 if entry is None else entry[0] + self.ttl - time.monotonic()
+
+    async def refresh(self, key, fetch):
+        return await asyncio.shield(self._start_fetch(key, fetch))
+
+    def set(self, key, articles, age=0.0):
+        self._entries[key] = (time.monotonic() - age, articles)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(self, key, fetch):
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._start_fetch(key, fetch)
+                return entry[1]
+
+        self.misses += 1
+        try:
+            # Shield so a cancelled waiter doesn't cancel the fetch other waiters share
+            return await asyncio.shield(self._start_fetch(key, fetch))
+        except Exception:
+            if entry is None:
+                raise
+            # Upstream is failing: an old result beats an error
+            self.fallbacks += 1
+            return entry[1]
+
+    def _start_fetch(self, key, fetch):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(key, fetch))
+            task.add_done_callback(self._log_failed_fetch)
+            self._inflight[key] = task
+        return task
+
+    async def _fetch_and_store(self, key, fetch):
+        try:
+            if self.backend.shared:
+                # Another worker may have fetched this topic already
+                shared = await self._load_shared(key)
+                if shared is not None:
+                    age, articles = shared
+                    self.set(key, articles, age)
+                    return articles
+            articles = await fetch()
+            if isinstance(articles, PartialResult):
+                previous = self._entries.get(key)
+                if previous is not None and previous[1]:
+                    return previous[1]
+                # Goes stale after partial_ttl, so the next request retries the full fan-out
+                self.set(key, articles, max(0.0, self.ttl - self.partial_ttl))
+                return articles
+            self.set(key, articles)
+            if self.backend.shared:
+                await self._save_shared(key, articles)
+            return articles
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load_shared(self, key):
+        try:
+            raw = await self.backend.get(f"news:{key}")
+        except Exception as e:
+            logging.warning("Shared news cache read failed: %r", e)
+            return None
+        if raw is None:
+            return None
+        fetched_at, articles = json.loads(raw)
+        age = max(0.0, time.time() - fetched_at)
+        return (age, articles) if age < self.ttl else None
+
+    async def _save_shared(self, key, articles):
+        try:
+            await self.backend.set(f"news:{key}", json.dumps([time.time(), articles]), self.ttl + self.stale_ttl)
+        except Exception as e:
+            logging.warning("Shared news cache write failed: %r", e)
+
+    @staticmethod
+    def _log_failed_fetch(task):
+        if not task.cancelled() and task.exception() is not None and not isinstance(task.exception(), CircuitOpenError):
+            logging.warning("News fetch failed: %s", task.exception())
+
+
+NEWS_CACHE = NewsCache(NEWS_CACHE_TTL, NEWS_CACHE_STALE_TTL, NEWS_CACHE_MAX_ENTRIES, STATE, NEWS_CACHE_PARTIAL_TTL)
+
+
+# Snapshots of news results that /news messages page through, keyed by a short id that
+# fits in callback data. The same cached result list always maps to the same id. With a
+# shared backend, published snapshots can be paged from any worker.
+class ResultSets:
+    def __init__(self, ttl, max_entries, backend):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.backend = backend
+        self._published = set()
+        self._sets = OrderedDict()  # set_id -> (created, topic, articles)
+        self._by_topic = {}  # topic -> set_id of its latest snapshot
+
+    def register(self, topic, articles):
+        set_id = self._by_topic.get(topic)
+        if set_id is not None:
+            entry = self._sets.get(set_id)
+            if entry is not None and entry[2] is articles and time.monotonic() - entry[0] < self.ttl:
+                return set_id
+
+        set_id = secrets.token_urlsafe(6)
+        self._sets[set_id] = (time.monotonic(), topic, articles)
+        self._by_topic[topic] = set_id
+        while len(self._sets) > self.max_entries:
+            old_id, (_, old_topic, _) = self._sets.popitem(last=False)
+            self._published.discard(old_id)
+            if self._by_topic.get(old_topic) not in self._sets:
+                self._by_topic.pop(old_topic, None)
+        return set_id
+
+    def get(self, set_id):
+        entry = self._sets.get(set_id)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1], entry[2]
+
+    async def publish(self, set_id):
+        if not self.backend.shared or set_id in self._published or set_id not in self._sets:
+            return
+        created, topic, articles = self._sets[set_id]
+        try:
+            await self.backend.set(f"resultset:{set_id}", json.dumps([topic, articles]), self.ttl - (time.monotonic() - created))
+            self._published.add(set_id)
+        except Exception as e:
+            logging.warning("Publishing result set failed: %r", e)
+
+    async def load(self, set_id):
+        result_set = self.get(set_id)
+        if result_set is not None or not self.backend.shared:
+            return result_set
+        try:
+            raw = await self.backend.get(f"resultset:{set_id}")
+        except Exception as e:
+            logging.warning("Loading result set failed: %r", e)
+            return None
+        if raw is None:
+            return None
+        topic, articles = json.loads(raw)
+        return topic, articles
+
+
+RESULT_SETS = ResultSets(NEWS_RESULT_SET_TTL, NEWS_RESULT_SET_MAX, STATE)
+
+
+# Exponentially decayed request counts per topic. Scores are stored relative to a fixed
+# epoch, so recording is O(1) and older requests fade out with the configured half-life.
+class TopicPopularity:
+    def __init__(self, half_life, max_topics):
+        self.half_life = half_life
+        self.max_topics = max_topics
+        self._epoch = time.monotonic()
+        self._scores = {}
+
+    def record(self, topic):
+        weight = 2 ** ((time.monotonic() - self._epoch) / self.half_life)
+        if weight > 2 ** 64:
+            # Rebase before the weights overflow
+            self._scores = {topic: score / weight for topic, score in self._scores.items()}
+            self._epoch = time.monotonic()
+            weight = 1.0
+        self._scores[topic] = self._scores.get(topic, 0.0) + weight
+        if len(self._scores) > self.max_topics:
+            # Drop the least popular half in one go rather than one entry per insert
+            keep = sorted(self._scores, key=self._scores.get, reverse=True)[:self.max_topics // 2]
+            self._scores = {topic: self._scores[topic] for topic in keep}
+
+    def top(self, n):
+        return sorted(self._scores, key=self._scores.get, reverse=True)[:n]
+
+
+TOPIC_POPULARITY = TopicPopularity(TOPIC_POPULARITY_HALF_LIFE, TOPIC_POPULARITY_MAX_TOPICS)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+# A CircuitOpenError, so everything that tolerates an open circuit tolerates this too
+class QuotaExhaustedError(CircuitOpenError):
+    pass
+
+
+class RetryableNewsError(Exception):
+    pass
+
+
+# Opens after `threshold` consecutive failures (or immediately on a 429) and rejects calls
+# until the cooldown passes; then a single probe request decides whether it closes again.
+class CircuitBreaker:
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    @property
+    def is_open(self):
+        return self.open_until > time.monotonic()
+
+    def allow(self):
+        if self.failures < self.threshold and not self.open_until:
+            return True
+        if self.is_open or self.probing:
+            return False
+        self.probing = True
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    def record_failure(self, retry_after=0.0):
+        self.failures += 1
+        self.probing = False
+        if self.failures >= self.threshold or retry_after or self.open_until:
+            self.open_until = time.monotonic() + max(self.cooldown, retry_after)
+
+
+NEWS_BREAKER = CircuitBreaker(NEWS_BREAKER_THRESHOLD, NEWS_BREAKER_COOLDOWN)
+
+
+async def request_articles(client, params):
+    if not await NEWS_QUOTA.take():
+        raise QuotaExhaustedError("NewsAPI daily quota is used up")
+    started = time.perf_counter()
+    try:
+        response = await client.get("/everything", params=params)
+        if response.status_code == 429 or response.status_code >= 500:
+            METRICS.news_api_error(str(response.status_code))
+            raise RetryableNewsError(response)
+        response.raise_for_status()
+        return response.json().get("articles", [])
+    except httpx.HTTPStatusError as e:
+        METRICS.news_api_error(str(e.response.status_code))
+        raise
+    except httpx.TransportError as e:
+        METRICS.news_api_error(type(e).__name__)
+        raise RetryableNewsError(e) from e
+    finally:
+        METRICS.news_api_latency.observe(time.perf_counter() - started)
+
+
+async def hedged_request(client, params):
+    # If the first request hasn't answered after NEWS_HEDGE_DELAY, race a second one
+    first = asyncio.create_task(request_articles(client, params))
+    tasks = {first}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=NEWS_HEDGE_DELAY)
+        if not done:
+            tasks.add(asyncio.create_task(request_articles(client, params)))
+        error = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_articles(client, topic):
+    if not NEWS_BREAKER.allow():
+        raise CircuitOpenError("NewsAPI circuit is open")
+    probe = NEWS_BREAKER.probing
+
+    params = {
+        "q": topic,
+        "searchIn": "title",
+        "language": "en",
+        "sortBy": "publishedAt",
+        "pageSize": NEWS_FETCH_PAGE_SIZE,
+    }
+    request = hedged_request if NEWS_HEDGE_DELAY > 0 else request_articles
+    deadline = time.monotonic() + NEWS_FETCH_DEADLINE
+    try:
+        for attempt in range(NEWS_FETCH_RETRIES + 1):
+            try:
+                articles = await asyncio.wait_for(request(client, params), deadline - time.monotonic())
+                NEWS_BREAKER.record_success()
+                return articles
+            except asyncio.TimeoutError:
+                METRICS.news_api_error("deadline")
+                NEWS_BREAKER.record_failure()
+                raise
+            except RetryableNewsError as e:
+                response = e.args[0]
+                if isinstance(response, httpx.Response) and response.status_code == 429:
+                    # Rate limited: retrying only burns more quota
+                    retry_after = response.headers.get("Retry-After", "")
+                    NEWS_BREAKER.record_failure(float(retry_after) if retry_after.isdigit() else NEWS_BREAKER_COOLDOWN)
+                    raise
+                backoff = NEWS_FETCH_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5)
+                if attempt == NEWS_FETCH_RETRIES or time.monotonic() + backoff >= deadline:
+                    NEWS_BREAKER.record_failure()
+                    raise
+                await asyncio.sleep(backoff)
+    finally:
+        # A probe that ended any other way (cancelled, unexpected error) must still
+        # release the half-open slot, or the breaker would never let another call through
+        if probe:
+            NEWS_BREAKER.probing = False
+
+# --- Quotas & Rate Limits ---
+
+# Counts NewsAPI calls (retries and hedges included) per UTC day. Once only `reserve`
+# calls are left, background work stops spending them and cached results are served
+# as they are; at zero no more calls are made until the next day. The count lives in
+# the state backend, so `used` is the latest total seen across all workers.
+class QuotaAccountant:
+    def __init__(self, daily_limit, reserve, backend):
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self.backend = backend
+        self.day = None
+        self.used = 0
+        self.rejected = 0
+
+    def _roll_over(self):
+        today = time.strftime("%Y-%m-%d", time.gmtime())
+        if today != self.day:
+            self.day = today
+            self.used = 0
+
+    @property
+    def remaining(self):
+        self._roll_over()
+        return max(0, self.daily_limit - self.used)
+
+    @property
+    def low(self):
+        return self.remaining <= self.reserve
+
+    async def take(self):
+        if not self.remaining:
+            self.rejected += 1
+            return False
+        try:
+            self.used = await self.backend.incr(f"quota:newsapi:{self.day}", 2 * 86400)
+        except Exception as e:
+            logging.warning("Quota accounting failed, counting locally: %r", e)
+            self.used += 1
+        if self.used > self.daily_limit:
+            self.rejected += 1
+            return False
+        return True
+
+
+NEWS_QUOTA = QuotaAccountant(NEWS_API_DAILY_QUOTA, NEWS_API_QUOTA_RESERVE, STATE)
+
+
+# One token bucket per user, stored as a (tokens, updated) tuple in access order. Idle
+# users sit at the front and are evicted (their bucket would be full again anyway), as
+# are the least recently seen once `max_users` is reached. With a shared backend, each
+# user instead gets `burst` requests per `burst / rate` seconds, counted across workers.
+class UserRateLimiter:
+    def __init__(self, rate, burst, max_users, idle, backend):
+        self.rate = rate
+        self.burst = burst
+        self.max_users = max_users
+        self.idle = idle
+        self.backend = backend
+        self._buckets = OrderedDict()  # user_id -> (tokens, updated)
+        self.limited = 0
+
+    def __len__(self):
+        return len(self._buckets)
+
+    async def acquire(self, user_id):
+        # Takes a token and returns 0, or returns the seconds until one is available
+        if self.backend.shared:
+            return await self._acquire_shared(user_id)
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(user_id, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / self.rate
+            self.limited += 1
+        self._buckets[user_id] = (tokens, now)
+
+        while len(self._buckets) > self.max_users or now - next(iter(self._buckets.values()))[1] > self.idle:
+            self._buckets.popitem(last=False)
+        return wait
+
+    async def _acquire_shared(self, user_id):
+        window = self.burst / self.rate
+        now = time.time()
+        slot = int(now // window)
+        try:
+            count = await self.backend.incr(f"rate:{user_id}:{slot}", window)
+        except Exception as e:
+            logging.warning("Shared rate limit check failed: %r", e)
+            return 0.0
+        if count <= self.burst:
+            return 0.0
+        self.limited += 1
+        return (slot + 1) * window - now
+
+
+USER_LIMITER = UserRateLimiter(USER_RATE_PER_MIN / 60, USER_RATE_BURST, USER_RATE_MAX_USERS, USER_RATE_IDLE, STATE)
+
+# --- News Sources ---
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_", "ref", "cmpid")
+
+
+class NewsApiSource:
+    name = "newsapi"
+    # fetch_articles enforces NEWS_FETCH_DEADLINE itself and feeds timeouts to the circuit
+    # breaker; the outer budget only backs that up, so it must not fire first
+    timeout = NEWS_FETCH_DEADLINE + 1
+
+    async def fetch(self, bot_data, topic):
+        return await fetch_articles(bot_data["http_client"], topic)
+
+
+def parse_feed_date(value):
+    if not value:
+        return ""
+    value = value.strip()
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return ""
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_feed(data, source_name):
+    from xml.etree import ElementTree  # feeds are optional, so only pay for the import when used
+
+    root = ElementTree.fromstring(data)
+    articles = []
+    for item in root.iter("item"):  # RSS 2.0
+        articles.append({
+            "title": (item.findtext("title") or "").strip(),
+            "url": (item.findtext("link") or "").strip(),
+            "description": (item.findtext("description") or "").strip(),
+            "publishedAt": parse_feed_date(item.findtext("pubDate")),
+            "source": {"name": source_name},
+        })
+    for entry in root.iter(ATOM_NS + "entry"):  # Atom
+        link = entry.find(ATOM_NS + "link[@rel='alternate']")
+        if link is None:
+            link = entry.find(ATOM_NS + "link")
+        articles.append({
+            "title": (entry.findtext(ATOM_NS + "title") or "").strip(),
+            "url": link.get("href", "").strip() if link is not None else "",
+            "description": (entry.findtext(ATOM_NS + "summary") or "").strip(),
+            "publishedAt": parse_feed_date(entry.findtext(ATOM_NS + "published") or entry.findtext(ATOM_NS + "updated")),
+            "source": {"name": source_name},
+        })
+    return [article for article in articles if article["title"] and article["url"]]
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# An RSS/Atom feed over HTTP(S) or from a local file. The parsed feed is reused for
+# NEWS_CACHE_TTL seconds, so different topics filter the same download.
+class FeedSource:
+    def __init__(self, location, timeout):
+        self.location = location
+        self.timeout = timeout
+        self.name = urlsplit(location).netloc or os.path.basename(location)
+        self._items = None
+        self._terms = None  # whole words of each item's title and description
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _load(self, bot_data):
+        if self.location.startswith(("http://", "https://")):
+            response = await bot_data["feed_client"].get(self.location)
+            response.raise_for_status()
+            data = response.content
+        else:
+            path = self.location[len("file://"):] if self.location.startswith("file://") else self.location
+            data = await asyncio.to_thread(read_bytes, path)
+        return await asyncio.to_thread(parse_feed, data, self.name)
+
+    async def fetch(self, bot_data, topic):
+        async with self._lock:
+            if self._items is None or time.monotonic() - self._fetched_at >= NEWS_CACHE_TTL:
+                self._items = await self._load(bot_data)
+                self._terms = [
+                    frozenset(WORD_RE.findall(f"{article['title']} {article['description']}".lower()))
+                    for article in self._items
+                ]
+                self._fetched_at = time.monotonic()
+        # Whole words only, so "ai" doesn't match "said" or "paint"
+        words = set(WORD_RE.findall(topic.lower()))
+        return [article for article, terms in zip(self._items, self._terms) if words <= terms]
+
+
+NEWS_SOURCES = [NewsApiSource()] + [FeedSource(feed, NEWS_FEED_TIMEOUT) for feed in NEWS_FEEDS]
+
+
+def normalize_url(url):
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query) if not key.lower().startswith(TRACKING_PARAMS)])
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, ""))
+
+
+def title_hash(title):
+    return hashlib.blake2b(" ".join(WORD_RE.findall(title.lower())).encode(), digest_size=8).digest()
+
+
+def merge_articles(result_lists):
+    seen_urls = set()
+    seen_titles = set()
+    merged = []
+    for articles in result_lists:
+        for article in articles:
+            if not article.get("url") or article.get("title") in (None, "", "[Removed]"):
+                continue
+            url_key = normalize_url(article["url"])
+            title_key = title_hash(article.get("title") or "")
+            if url_key in seen_urls or title_key in seen_titles:
+                continue
+            seen_urls.add(url_key)
+            seen_titles.add(title_key)
+            merged.append(article)
+    merged.sort(key=lambda article: article.get("publishedAt") or "", reverse=True)
+    return merged[:NEWS_FETCH_PAGE_SIZE]
+
+
+async def fetch_from_source(source, bot_data, topic):
+    started = time.perf_counter()
+    try:
+        return await asyncio.wait_for(source.fetch(bot_data, topic), source.timeout)
+    except Exception:
+        METRICS.source_error(source.name)
+        raise
+    finally:
+        METRICS.observe_source(source.name, time.perf_counter() - started)
+
+
+# Queries every source concurrently; a slow or failing source only costs its own budget.
+# Fails when every source failed, or when NewsAPI failed and the feeds found nothing,
+# re-raising the first error. Without NewsAPI, what the feeds found is a PartialResult.
+async def aggregate_news(bot_data, topic):
+    results = await asyncio.gather(
+        *(fetch_from_source(source, bot_data, topic) for source in NEWS_SOURCES),
+        return_exceptions=True,
+    )
+    succeeded = [result for result in results if not isinstance(result, BaseException)]
+    if not succeeded:
+        raise results[0]
+    newsapi_error = None
+    for source, result in zip(NEWS_SOURCES, results):
+        if isinstance(result, BaseException):
+            if isinstance(source, NewsApiSource):
+                newsapi_error = result
+            if not isinstance(result, CircuitOpenError):
+                logging.warning("News source %s failed: %r", source.name, result)
+    articles = merge_articles(succeeded)
+    if newsapi_error is not None:
+        if not articles:
+            raise newsapi_error
+        return PartialResult(articles)
+    return articles
+
+
+async def get_news(bot_data, topic):
+    # With the quota running low, anything still cached (even stale) is served without a refresh
+    if NEWS_QUOTA.low:
+        articles = NEWS_CACHE.peek(topic)
+        if articles is not None:
+            return articles
+    return await NEWS_CACHE.get_or_fetch(topic, lambda: aggregate_news(bot_data, topic))
+
+# --- Quote Store ---
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by do for from has have i if in is it its me my no not "
+    "of on or so that the their them they this to was we what when will with you your".split()
 )
 
-# IMPORTANT: Replace these with env vars in production
-TOKEN = os.getenv("TOKEN")
-NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 
-COMMANDS = {
-    "start": "🚀 Start the bot",
-    "news": "📰 Get news on a topic",
-    "about": "🌍 Learn about OpenStart",
-    "quote": "💡 Get a motivational quote",
-    "help": "❓ See this list of commands",
-    "team": "👥 Meet the OpenStart team",
-    "events": "📅 See upcoming events",
-    "mentor": "🎓 Learn about mentorship",
-    "resources": "📚 Access learning materials",
-    "faq": "❔ Frequently Asked Questions",
-    "apply": "📝 How to apply for programs",
-    "contact": "📩 Get in touch with the team",
-    "feedback": "💬 Share your feedback with us",
-    "community": "🌐 Join our global community",
+def tokenize(text):
+    return [word for word in WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+# Loaded once; quote ids are compact array('H') entries in the author/keyword indexes
+# and in each user's shuffle bag, so /quote never repeats until the bag is exhausted.
+class QuoteStore:
+    def __init__(self, lines):
+        quotes = []
+        authors = []
+        seen = set()
+        for line in lines:
+            line = line.strip()
+            if not line or line in seen:
+                continue
+            seen.add(line)
+            text, sep, author = line.rpartition(" - ")
+            quotes.append(line)
+            authors.append(sys.intern(author) if sep else "")
+
+        self.quotes = tuple(quotes)
+        self.authors = tuple(authors)
+        self.author_index = self._build_index(self.authors)
+        self.keyword_index = self._build_index(
+            line.rpartition(" - ")[0] or line for line in self.quotes
+        )
+        self._bags = OrderedDict()  # user_id -> array of remaining quote ids
+
+    @staticmethod
+    def _build_index(texts):
+        index = {}
+        for quote_id, text in enumerate(texts):
+            for token in set(tokenize(text)):
+                index.setdefault(sys.intern(token), array("H")).append(quote_id)
+        return index
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(f)
+
+    def __len__(self):
+        return len(self.quotes)
+
+    def next_for_user(self, user_id):
+        bag = self._bags.pop(user_id, None) or self._new_bag()
+        quote_id = bag.pop()
+        if not bag:
+            bag = self._new_bag()
+            if len(bag) > 1 and bag[-1] == quote_id:
+                bag[0], bag[-1] = bag[-1], bag[0]
+        self._bags[user_id] = bag
+        if len(self._bags) > QUOTE_BAGS_MAX_USERS:
+            self._bags.popitem(last=False)
+        return quote_id
+
+    def _new_bag(self):
+        ids = list(range(len(self.quotes)))
+        random.shuffle(ids)
+        return array("H", ids)
+
+    def matches(self, query):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        for index in (self.author_index, self.keyword_index):
+            postings = [index.get(token) for token in tokens]
+            if all(postings):
+                result = set(postings[0]).intersection(*postings[1:])
+                if result:
+                    return sorted(result)
+        return []
+
+    def search(self, query):
+        found = self.matches(query)
+        return random.choice(found) if found else None
+
+
+_quote_store = None
+_quotes_mtime = None
+
+
+def get_quote_store():
+    global _quote_store, _quotes_mtime
+    if _quote_store is None:
+        _quotes_mtime = os.path.getmtime(QUOTES_FILE)
+        _quote_store = QuoteStore.from_file(QUOTES_FILE)
+    return _quote_store
+
+# --- Rendering ---
+
+# Everything the bot formats is sent as HTML: user-supplied text (names, article titles,
+# topics) only needs <, > and & escaped, and HTML has no context-dependent escapes.
+MESSAGE_LIMIT = 4096
+NEWS_TITLE_MAX = 300
+
+
+class Markup(str):
+    """Text that is already valid Telegram HTML and is inserted into templates as is."""
+
+
+def escape_html(text):
+    return html.escape(str(text))
+
+
+# A str.format-style template parsed once at import. Every field is HTML-escaped unless it
+# is Markup; conversions and format specs are not supported.
+class Template:
+    def __init__(self, source):
+        self.parts = [(literal, field) for literal, field, _, _ in string.Formatter().parse(source)]
+
+    def render(self, **fields):
+        out = []
+        for literal, field in self.parts:
+            out.append(literal)
+            if field is not None:
+                value = fields[field]
+                out.append(value if isinstance(value, Markup) else escape_html(value))
+        return Markup("".join(out))
+
+
+HTML_TAG_RE = re.compile(r"<(/?)([a-z-]+)[^>]*>")
+
+
+def split_message(text, limit=MESSAGE_LIMIT):
+    # Splits at paragraph breaks, then line breaks, and only as a last resort mid-line
+    # (never inside a tag or an entity). Tags still open at a cut are closed at the end
+    # of the chunk and reopened at the start of the next, so every chunk is valid HTML.
+    chunks = []
+    budget = limit - 100  # room for the closing tags
+    while len(text) > limit:
+        cut = text.rfind("\n\n", 0, budget)
+        if cut <= 0:
+            cut = text.rfind("\n", 0, budget)
+        if cut <= 0:
+            cut = budget
+            for opener, closer in (("<", ">"), ("&", ";")):
+                start = text.rfind(opener, 0, cut)
+                if start > 0 and text.rfind(closer, start, cut) == -1:
+                    cut = start
+        head, text = text[:cut].rstrip(), text[cut:].lstrip("\n")
+        open_tags = []
+        for match in HTML_TAG_RE.finditer(head):
+            if not match[1]:
+                open_tags.append((match[2], match[0]))
+            elif open_tags and open_tags[-1][0] == match[2]:
+                open_tags.pop()
+        chunks.append(head + "".join(f"</{name}>" for name, _ in reversed(open_tags)))
+        text = "".join(tag for _, tag in open_tags) + text
+    chunks.append(text)
+    return chunks
+
+
+async def send_rendered(send, text, parse_mode='HTML', reply_markup=None, **kwargs):
+    # `send` is message.reply_text or a bot.send_message partial. Texts over the limit go
+    # out as several messages, with the keyboard on the last one.
+    chunks = split_message(text)
+    for chunk in chunks[:-1]:
+        await send(chunk, parse_mode=parse_mode, **kwargs)
+    return await send(chunks[-1], parse_mode=parse_mode, reply_markup=reply_markup, **kwargs)
+
+
+# Rendered output keyed by what it was rendered from, so a cached result set is
+# formatted once rather than for every user who pages through it.
+class RenderCache:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key, render):
+        rendered = self._entries.get(key)
+        if rendered is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return rendered
+        self.misses += 1
+        rendered = self._entries[key] = render()
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return rendered
+
+
+NEWS_PAGES = RenderCache(NEWS_RESULT_SET_MAX)
+
+WELCOME_TEMPLATE = Template(
+    "Hi {name}! 👋\n\n"
+    "Welcome to the <b>OpenStart Project Bot</b>!\n\n"
+    "I'm your assistant for all things related to startups, funding, and innovation for young founders. "
+    "What would you like to do first?"
+)
+NEWS_HEADING_TEMPLATE = Template("<b>{heading} for '{topic}'</b>\n\n")
+NEWS_ITEM_TEMPLATE = Template('▪️ <a href="{url}">{title}</a>\n\n')
+NEWS_ITEM_UNLINKED_TEMPLATE = Template("▪️ {title}\n\n")
+QUOTE_TEMPLATE = Template("💡 <b>“{quote}”</b>")
+DIGEST_HEADING = Markup("🗞 <b>Your daily OpenStart news digest</b>\n\n")
+
+# --- Static Responses ---
+
+StaticReply = namedtuple("StaticReply", ["text", "parse_mode", "reply_markup"], defaults=(None, None))
+
+START_KEYBOARD = ReplyKeyboardMarkup(
+    [
+        [KeyboardButton("/news funding"), KeyboardButton("/quote")],
+        [KeyboardButton("/team"), KeyboardButton("/help")]
+    ],
+    resize_keyboard=True,
+    one_time_keyboard=False,
+)
+
+ABOUT_REPLY = StaticReply(
+    "<b>🌍 About OpenStart</b>\n\n"
+    "OpenStart is a global accelerator program for <b>high school students</b>. "
+    "Our mission is to connect ambitious young minds with world-class mentorship, resources, and opportunities to build real, meaningful projects.",
+    parse_mode='HTML',
+)
+
+TEAM_REPLY = StaticReply(
+    "<b>👥 The OpenStart Team</b>\n\n"
+    "Our team is a global collaboration of passionate young leaders:\n"
+    "▪️ <b>Vikusyaaa</b> (Ukraine)\n"
+    "▪️ <b>Rakesh Kumar</b> (India)\n"
+    "▪️ <b>Cheedhe</b> (Tunisia)",
+    parse_mode='HTML',
+)
+
+EVENTS_REPLY = StaticReply("📅 Upcoming events and deadlines will be announced here soon. Stay tuned!")
+
+RESOURCES_REPLY = StaticReply("📚 We are compiling a library of guides, books, and tools for young founders. This feature will be available shortly!")
+
+COMMUNITY_REPLY = StaticReply(
+    "🌐 Join our global community of young innovators on Discord to connect, collaborate, and share ideas!",
+    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("Join Discord", url="https://discord.gg/your-invite-link")]]),  # Replace with real link
+)
+
+MENTOR_REPLY = StaticReply("🎓 We will initially assign a mentor for you related to your startup niche and business tech.")
+
+FAQ_REPLY = StaticReply(
+    "<b>❔ Frequently Asked Questions</b>\n\n"
+    "<b>Q: Who can apply for OpenStart?</b>\n"
+    "A: Ambitious high school students from anywhere in the world!\n\n"
+    "<b>Q: Is there a fee to participate?</b>\n"
+    "A: Our goal is to make our programs as accessible as possible. Details about costs will be available soon.",
+    parse_mode='HTML',
+)
+
+CONTACT_REPLY = StaticReply("📩 You can visit our website to get in touch with the OpenStart team.")
+
+
+async def send_static(update: Update, reply):
+    await send_rendered(update.message.reply_text, reply.text, reply.parse_mode, reply.reply_markup)
+
+
+def static_handler(command, reply):
+    async def handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        await send_static(update, reply)
+
+    handler.__name__ = command
+    return handler
+
+# --- Application Forms ---
+
+# /apply and /feedback ask their questions one at a time in the chat. Answers are kept in a
+# FormSession until the last one arrives, then written to the user store in one batched
+# insert, so a half-finished form never touches the disk.
+FormStep = namedtuple("FormStep", "field question parse error optional", defaults=(None, None, False))
+Form = namedtuple("Form", "intro steps done")
+
+
+def parse_age(text):
+    age = int(text)
+    if not 10 <= age <= 100:
+        raise ValueError(text)
+    return age
+
+
+def parse_email(text):
+    if not re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", text):
+        raise ValueError(text)
+    return text
+
+
+def parse_rating(text):
+    rating = int(text)
+    if not 1 <= rating <= 5:
+        raise ValueError(text)
+    return rating
+
+
+FORMS = {
+    "apply": Form(
+        intro="📝 Let's get your application started! Answer a few quick questions, or send /cancel at any time.",
+        steps=(
+            FormStep("name", "What's your full name?"),
+            FormStep("age", "How old are you?", parse_age, "Please send your age as a number, e.g. 16."),
+            FormStep("country", "Which country are you from?"),
+            FormStep("idea", "Tell us about your startup idea, or what you'd like to build with OpenStart."),
+            FormStep("email", "What email address can we reach you at?", parse_email, "That doesn't look like an email address. Please try again."),
+        ),
+        done="✅ Thanks, your application has been received! We will respond to you within 48 hours.",
+    ),
+    "feedback": Form(
+        intro="💬 We'd love to hear what you think! Send /cancel at any time to stop.",
+        steps=(
+            FormStep("message", "What would you like to tell us?"),
+            FormStep("rating", "How would you rate OpenStart from 1 to 5? Send /skip to leave it out.", parse_rating, "Please send a number from 1 to 5, or /skip.", optional=True),
+        ),
+        done="🙏 Thank you for your feedback!",
+    ),
+}
+
+class FormSession:
+    __slots__ = ("form", "step", "answers", "expires")
+
+    def __init__(self, form, expires):
+        self.form = form
+        self.step = 0
+        self.answers = {}
+        self.expires = expires
+
+
+# Open forms keyed by (chat_id, user_id), least recently active first. This is the only
+# conversation state: a user's messages go to their form for as long as a session exists.
+# Every session shares the same TTL, so the expired ones are always at the front and cost
+# O(1) to drop; a flood of new forms past max_sessions pushes out the longest-idle ones
+# instead of growing memory. With a shared backend, sessions live there instead (expiring
+# with the same TTL), so a user's next answer can reach any worker.
+class FormSessions:
+    def __init__(self, ttl, max_sessions, backend):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.backend = backend
+        self._sessions = OrderedDict()
+        self.expired = 0
+        self.evicted = 0
+        self.submitted = {}  # form -> count
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, key):
+        self._expire(time.monotonic())
+        return key in self._sessions
+
+    def _expire(self, now):
+        while self._sessions and next(iter(self._sessions.values())).expires <= now:
+            self._sessions.popitem(last=False)
+            self.expired += 1
+
+    @staticmethod
+    def _shared_key(key):
+        return f"form:{key[0]}:{key[1]}"
+
+    async def start(self, key, form):
+        if self.backend.shared:
+            session = FormSession(form, 0.0)
+            await self.save(key, session)
+            return session
+        now = time.monotonic()
+        self._expire(now)
+        self._sessions.pop(key, None)
+        while len(self._sessions) >= self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.evicted += 1
+        session = self._sessions[key] = FormSession(form, now + self.ttl)
+        return session
+
+    async def get(self, key):
+        if self.backend.shared:
+            return await self._get_shared(key)
+        now = time.monotonic()
+        self._expire(now)
+        session = self._sessions.get(key)
+        if session is not None:
+            session.expires = now + self.ttl
+            self._sessions.move_to_end(key)
+        return session
+
+    async def _get_shared(self, key):
+        try:
+            raw = await self.backend.get(self._shared_key(key))
+        except Exception as e:
+            logging.warning("Loading form session failed: %r", e)
+            return None
+        if raw is None:
+            return None
+        form, step, answers = json.loads(raw)
+        session = FormSession(form, 0.0)
+        session.step = step
+        session.answers = answers
+        return session
+
+    async def save(self, key, session):
+        # Local sessions are changed in place; shared ones are written back after each answer
+        if not self.backend.shared:
+            return
+        try:
+            await self.backend.set(self._shared_key(key), json.dumps([session.form, session.step, session.answers]), self.ttl)
+        except Exception as e:
+            logging.warning("Saving form session failed: %r", e)
+
+    async def finish(self, key, session):
+        self.submitted[session.form] = self.submitted.get(session.form, 0) + 1
+        await self.discard(key)
+
+    async def discard(self, key):
+        if not self.backend.shared:
+            self._sessions.pop(key, None)
+            return
+        try:
+            await self.backend.delete(self._shared_key(key))
+        except Exception as e:
+            logging.warning("Removing form session failed: %r", e)
+
+
+FORM_SESSIONS = FormSessions(FORM_SESSION_TTL, FORM_MAX_SESSIONS, STATE)
+
+
+def form_session_key(update):
+    return update.effective_chat.id, update.effective_user.id
+
+
+def form_handler(name):
+    form = FORMS[name]
+
+    async def handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if update.effective_chat.type != "private":
+            # Answers are plain messages, which the bot can't see in groups
+            await update.message.reply_text(f"📩 Please send /{name} to me in a private chat.")
+            return
+        # Replaces any unfinished form of this user
+        await FORM_SESSIONS.start(form_session_key(update), name)
+        await update.message.reply_text(f"{form.intro}\n\n{form.steps[0].question}")
+
+    handler.__name__ = name
+    return handler
+
+
+async def advance_form(update: Update, session):
+    form = FORMS[session.form]
+    key = form_session_key(update)
+    session.step += 1
+    if session.step < len(form.steps):
+        await FORM_SESSIONS.save(key, session)
+        await update.message.reply_text(form.steps[session.step].question)
+        return
+
+    await FORM_SESSIONS.finish(key, session)
+    USER_STORE.add_submission(session.form, key[1], key[0], session.answers)
+    await update.message.reply_text(form.done)
+
+
+async def form_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    session = await FORM_SESSIONS.get(form_session_key(update))
+    if session is None:
+        # Only possible with a shared backend, where every private message is checked here
+        await handle_message(update, context)
+        return
+    step = FORMS[session.form].steps[session.step]
+    text = update.message.text.strip()
+    if len(text) > FORM_ANSWER_MAX_CHARS:
+        await update.message.reply_text(f"That's a bit long. Please keep your answer under {FORM_ANSWER_MAX_CHARS} characters.")
+        return
+    if step.parse is not None:
+        try:
+            text = step.parse(text)
+        except ValueError:
+            await update.message.reply_text(step.error)
+            return
+    session.answers[step.field] = text
+    await advance_form(update, session)
+
+
+async def form_skip(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    session = await FORM_SESSIONS.get(form_session_key(update))
+    if session is None:
+        await update.message.reply_text("There's no form in progress. Send /apply or /feedback to start one.")
+        return
+    if not FORMS[session.form].steps[session.step].optional:
+        await update.message.reply_text("This question can't be skipped. Send /cancel to stop.")
+        return
+    await advance_form(update, session)
+
+
+async def form_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    key = form_session_key(update)
+    if await FORM_SESSIONS.get(key) is None:
+        await update.message.reply_text("There's no form in progress.")
+        return
+    await FORM_SESSIONS.discard(key)
+    await update.message.reply_text("❌ Cancelled. Nothing was saved.")
+
+
+FORM_COMMAND_HANDLERS = {
+    "skip": form_skip,
+    "cancel": form_cancel,
 }
 
+
+# Matches text messages from users who have a form open. Filters can't wait on a shared
+# backend, so there every private message goes to form_answer, which checks for itself.
+class FormSessionFilter(filters.MessageFilter):
+    def filter(self, message):
+        return FORM_SESSIONS.backend.shared or (message.chat.id, message.from_user.id) in FORM_SESSIONS
+
 # --- Command Functions ---
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    user = update.effective_user
-    welcome_message = (
-        f"Hi {user.first_name}! 👋\n\n"
-        "Welcome to the **OpenStart Project Bot**!\n\n"
-        "I'm your assistant for all things related to startups, funding, and innovation for young founders. "
-        "What would you like to do first?"
-    )
-    keyboard = [
-        [KeyboardButton("/news funding"), KeyboardButton("/quote")],
-        [KeyboardButton("/team"), KeyboardButton("/help")]
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=False)
-    await update.message.reply_text(welcome_message, parse_mode='Markdown', reply_markup=reply_markup)
+    welcome_message = WELCOME_TEMPLATE.render(name=update.effective_user.first_name)
+    await send_rendered(update.message.reply_text, welcome_message, reply_markup=START_KEYBOARD)
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    help_text = "Here's the full list of what I can do for you:\n\n"
-    for command, description in COMMANDS.items():
-        help_text += f"/{command} - {description}\n"
-    await update.message.reply_text(help_text)
+    await send_static(update, HELP_REPLY)
 
 
-async def about(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    about_text = (
-        "**🌍 About OpenStart**\n\n"
-        "OpenStart is a global accelerator program for **high school students**. "
-        "Our mission is to connect ambitious young minds with world-class mentorship, resources, and opportunities to build real, meaningful projects."
-    )
-    await update.message.reply_text(about_text, parse_mode='Markdown')
+def format_news(topic, articles, heading=None):
+    parts = [NEWS_HEADING_TEMPLATE.render(heading=heading or f"Top {len(articles)} News Articles", topic=topic.title())]
+    for article in articles:
+        url = article.get("url") or ""
+        template = NEWS_ITEM_TEMPLATE if url.startswith(("https://", "http://")) else NEWS_ITEM_UNLINKED_TEMPLATE
+        parts.append(template.render(title=article["title"][:NEWS_TITLE_MAX], url=url))
+    return Markup("".join(parts))
+
+
+def news_page(set_id, topic, articles, page):
+    pages = max(1, -(-len(articles) // NEWS_PAGE_SIZE))
+    page = min(max(page, 0), pages - 1)
+    return NEWS_PAGES.get_or_render((set_id, page), lambda: render_news_page(set_id, topic, articles, page, pages))
+
+
+def render_news_page(set_id, topic, articles, page, pages):
+    start = page * NEWS_PAGE_SIZE
+    text = format_news(topic, articles[start:start + NEWS_PAGE_SIZE], heading="Latest News") + f"Page {page + 1}/{pages}"
+
+    buttons = []
+    if page > 0:
+        buttons.append(InlineKeyboardButton("⬅️ Prev", callback_data=f"news:{set_id}:{page - 1}"))
+    if page < pages - 1:
+        buttons.append(InlineKeyboardButton("Next ➡️", callback_data=f"news:{set_id}:{page + 1}"))
+    return text, InlineKeyboardMarkup([buttons]) if buttons else None
 
 
 async def news(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    topic = " ".join(context.args) if context.args else "startup"
-    await update.message.reply_text(f"🔍 Searching for the latest news about '{topic}'...")
+    topic = normalize_topic(" ".join(context.args)) if context.args else "startup"
+    if NEWS_CACHE.peek(topic) is None:
+        wait = await USER_LIMITER.acquire(update.effective_user.id)
+        if wait:
+            await update.message.reply_text(f"⏳ You're asking for news a little too fast. Please try again in {math.ceil(wait)}s.")
+            return
+        await send_rendered(update.message.reply_text, f"🔍 Searching for the latest news about '{topic}'...", parse_mode=None)
+    TOPIC_POPULARITY.record(topic)
 
-    url = f"https://newsapi.org/v2/everything?q={topic}&searchIn=title&language=en&sortBy=publishedAt&pageSize=5&apiKey={NEWS_API_KEY}"
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-            articles = data.get("articles", [])
-            if not articles:
-                await update.message.reply_text(f"Sorry, I couldn't find any recent news for '{topic}'.")
-                return
+        articles = await get_news(context.bot_data, topic)
+        if not articles:
+            await send_rendered(update.message.reply_text, f"Sorry, I couldn't find any recent news for '{topic}'.", parse_mode=None)
+            return
 
-            news_message = f"**Top 5 News Articles for '{topic.title()}'**\n\n"
-            for article in articles:
-                news_message += f"▪️ [{article['title']}]({article['url']})\n\n"
-
-            await update.message.reply_text(news_message, parse_mode='Markdown', disable_web_page_preview=True)
+        set_id = RESULT_SETS.register(topic, articles)
+        await RESULT_SETS.publish(set_id)
+        text, reply_markup = news_page(set_id, topic, articles, 0)
+        await send_rendered(update.message.reply_text, text, reply_markup=reply_markup, disable_web_page_preview=True)
 
+    except QuotaExhaustedError:
+        await update.message.reply_text("📰 We've used up today's news budget. Popular topics are still available, or try again tomorrow!")
+    except CircuitOpenError:
+        await update.message.reply_text("📰 The news service is temporarily unavailable. Please try again in a few minutes.")
     except Exception as e:
-        logging.error(f"News command error: {e}")
+        logging.error("News command error: %s", e)
         await update.message.reply_text("Sorry, an error occurred while fetching news.")
 
 
+async def news_page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    _, set_id, page = query.data.split(":")
+    result_set = await RESULT_SETS.load(set_id)
+    if result_set is None:
+        await query.answer("These results have expired. Send /news again for fresh ones.", show_alert=True)
+        return
+
+    topic, articles = result_set
+    text, reply_markup = news_page(set_id, topic, articles, int(page))
+    await query.answer()
+    await query.edit_message_text(text, parse_mode='HTML', disable_web_page_preview=True, reply_markup=reply_markup)
+
+
+async def digest(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    choice = context.args[0].lower() if context.args else ""
+    if choice not in ("on", "off"):
+        await update.message.reply_text(f"🗞 Use /digest on to get a daily news digest at {DIGEST_TIME} UTC, or /digest off to stop it.")
+        return
+    USER_STORE.record(update.effective_user, update.effective_chat)
+    await USER_STORE.flush()
+    await USER_STORE.set_digest(update.effective_chat.id, choice == "on")
+    if choice == "on":
+        await update.message.reply_text(f"✅ You'll get a daily news digest at {DIGEST_TIME} UTC.")
+    else:
+        await update.message.reply_text("👍 Daily digest turned off.")
+
+
 async def quote(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    quotes = [
-        "The best way to predict the future is to create it. - Peter Drucker",
-        "Your most unhappy customers are your greatest source of learning. - Bill Gates",
-        "It’s not about ideas. It’s about making ideas happen. - Scott Belsky",
-        "A goal is a dream with a deadline. - Napoleon Hill",
-"A goal properly set is halfway reached. - Zig Ziglar",
-"A good conscience is a continual Christmas. - Benjamin Franklin",
-"A guaranteed way to be miserable is to spend all your time trying to make everyone else happy. - Larry Winget",
-"A man wrapped up in himself makes a very small bundle. - Benjamin Franklin",
-"A mediocre idea that generates enthusiasm will go further than a great idea that inspires no one. - Mary Kay Ash",
-"A strong foundation at home sets you up for a strong foundation at work. - Robin Sharma",
-"Accept the challenges so you can feel the exhilaration of victory. - George S. Patton",
-"Accept your teammates for what they are and inspire them to become all they can be. - Robin Sharma",
-"Act as if what you do makes a difference. It does. - William James",
-"Action is the foundational key to all success. - Pablo Picasso",
-"Aim for the moon. If you miss you may hit a star. - W. Clement Stone",
-"All great thinkers are initially ridiculed – and eventually revered. - Robin Sharma",
-"All of your dreams await just on the other side of your fears. - Grant Cardone",
-"Always choose the future over the past. What do we do now? - Brian Tracy",
-"Always do your best. What you plant now, you will harvest later. - Og Mandino",
-"Always give without remembering and always receive without forgetting. - Brian Tracy",
-"Amateurs sit and wait for inspiration, the rest of us just get up and go to work. - Stephen King",
-"An attitude of a positive expectation is the mark of the superior personality. - Brian Tracy",
-"Anger is never without a reason, but seldom with a good one. - Benjamin Franklin",
-"Any fool can criticize, condemn and complain - and most fools do. - Benjamin Franklin",
-"Any thought or action that you repeat over and over will eventually become a new habit. - Brian Tracy",
-"Arriving at one goal is the starting point to another. - John Dewey",
-"As we each express our natural genius, we all elevate our world. - Robin Sharma",
-"Be gentle to all and stern with yourself. - Saint Teresa of Avila",
-"Be kind whenever possible. It is always possible. - Dalai Lama",
-"Be miserable. Or motivate yourself. Whatever has to be done, it's always your choice. - Wayne Dyer",
-"Become a person who would attract the results you seek. - Jim Cathcart",
-"Before you begin scrambling up the ladder of success, make sure that it is leaning against the right building. - Brian Tracy",
-"Being the richest man in the cemetery doesn't matter to me. Going to bed at night saying we've done something wonderful, that's what matters to me. - Steve Jobs",
-"Belief triggers the power to do. - David J. Schwartz",
-"Believe you can and you're halfway there. - Theodore Roosevelt",
-"Big shots are only little shots who keep shooting. - Christopher Morley",
-"Business is like riding a bicycle. Either you keep moving or you fall down. - Frank Lloyd Wright",
-"By failing to prepare, you are preparing to fail. - Benjamin Franklin",
-"Change is hardest at the beginning, messiest in the middle and best at the end. - Robin Sharma",
-"Clarity precedes mastery. Craft clear and precise plans/goals/deliverables. And then block out all else. - Robin Sharma",
-"Courage is not absence of fear; it is control of fear, mastery of fear. - Mark Twain",
-"Crush your fears with ACTION. - Russell Frazier",
-"Daily exercise is an insurance policy against future illness. The best Leaders Without Titles are the fittest. - Robin Sharma",
-"Deserve your dream. - Octavio Paz",
-"Discipline is the bridge between goals and accomplishment. - Jim Rohn",
-"Discipline is what you must have to resist the lure of excuses. - Brian Tracy",
-"Do not let what you cannot do interfere with what you can do. - John Wooden",
-"Do or do not. There is no try. - Yoda",
-"Do something wonderful, people may imitate it. - Albert Schweitzer",
-"Do the difficult things while they are easy and do the great things while they are small. A journey of a thousand miles must begin with a single step. - Lao Tzu",
-"Do what you can, with what you have, where you are. - Theodore Roosevelt",
-"Doing the best at this moment puts you in the best place for the next moment. - Oprah Winfrey",
-"Don't be afraid to give up the good to go for the great. - John D. Rockefeller",
-"Don't be pushed by your problems; be led by your dreams. - Unknown",
-"Don't let what you cannot do interfere with what you can do. - John Wooden",
-"Don't spend time beating on a wall, hoping to transform it into a door. - Coco Chanel",
-"Dream big and dare to fail. - Norman Vaughan",
-"Dreams are today's answers to tomorrow's questions. - Edgar Cayce",
-"Eighty percent of success is showing up. - Woody Allen",
-"Even if you're on the right track, you'll get run over if you just sit there. - Will Rogers",
-"Every child is an artist. The problem is how to remain an artist once he grows up. - Pablo Picasso",
-"Every day is a new beginning, take a deep breath and start again. - Unknown",
-"Every strike brings me closer to the next home run. - Babe Ruth",
-"Everything has beauty, but not everyone can see. - Confucius",
-"Everything that irritates us about others can lead us to an understanding of ourselves. - Carl Jung",
-"Everything you’ve ever wanted is on the other side of fear. - George Addair",
-"Experience is the teacher of all things. - Julius Caesar",
-"Fall seven times and stand up eight. - Japanese Proverb",
-"Fear is the disease. Hustle is the antidote. - Travis Kalanick",
-"First, have a definite, clear practical ideal; a goal, an objective. Second, have the necessary means to achieve your ends; wisdom, money, materials, and methods. Third, adjust all your means to that end. - Aristotle",
-"For small creatures such as we the vastness is bearable only through love. - Carl Sagan",
-"Forget past mistakes. Forget failures. Forget everything except what you're going to do now and do it. - William Durant",
-"From a small seed a mighty trunk may grow. - Aeschylus",
-"Get out of your head and get into your heart. Think less, feel more. - Osho",
-"Give me a lever long enough and a fulcrum on which to place it, and I shall move the world. - Archimedes",
-"Go as far as you can see; when you get there, you'll be able to see farther. - J. P. Morgan",
-"Go confidently in the direction of your dreams. Live the life you have imagined. - Henry David Thoreau",
-"Goals may give focus, but dreams give power. - John Maxwell",
-"Good, better, best. Never let it rest. 'Til your good is better and your better is best. - St. Jerome",
-"Great acts are made up of small deeds. - Lao Tzu",
-"Happiness is not something readymade. It comes from your own actions. - Dalai Lama",
-"Happiness often sneaks in through a door you didn't know you left open. - John Barrymore",
-"He who has health has hope; and he who has hope has everything. - Arabian Proverb",
-"He who has a why to live can bear almost any how. - Friedrich Nietzsche",
-"He who is not courageous enough to take risks will accomplish nothing in life. - Muhammad Ali",
-"Health is the greatest gift, contentment the greatest wealth, faithfulness the best relationship. - Buddha",
-"High expectations are the key to everything. - Sam Walton",
-"How wonderful it is that nobody need wait a single moment before starting to improve the world. - Anne Frank",
-"I am not a product of my circumstances. I am a product of my decisions. - Stephen Covey",
-"I attribute my success to this: I never gave or took an excuse. - Florence Nightingale",
-"I can, therefore I am. - Simone Weil",
-"I didn't fail the test. I just found 100 ways to do it wrong. - Benjamin Franklin",
-"I have learned over the years that when one's mind is made up, this diminishes fear. - Rosa Parks",
-"I never dreamed about success, I worked for it. - Estee Lauder",
-"I think I can. I know I can. - Unknown",
-"I would rather die of passion than of boredom. - Vincent van Gogh",
-"I'd rather attempt to do something great and fail than to attempt to do nothing and succeed. - Robert H. Schuller",
-"If it scares you, it may be a good thing to try. - Seth Godin",
-"If the world seems cold to you, kindle fires to warm it. - Lucy Larcom",
-"If you aim at nothing, you'll hit it every time. - Unknown",
-"If you are not willing to risk the usual you will have to settle for the ordinary. - Jim Rohn",
-"If you can dream it, you can achieve it. - Zig Ziglar",
-"If you do what you've always done, you'll get what you've always gotten. - Tony Robbins",
-"If you don't like something, change it. If you can't change it, change your attitude. - Maya Angelou",
-"If you don't risk anything, you risk even more. - Erica Jong",
-"If you hear a voice within you say 'you cannot paint,' then by all means paint and that voice will be silenced. - Vincent Van Gogh",
-"If you want to lift yourself up, lift up someone else. - Booker T. Washington",
-"If you want to succeed you should strike out on new paths, rather than travel the worn paths of accepted success. - John D. Rockefeller",
-"If you're offered a seat on a rocket ship, don't ask what seat! Just get on. - Sheryl Sandberg",
-"Imagination is more important than knowledge. - Albert Einstein",
-"In a gentle way, you can shake the world. - Mahatma Gandhi",
-"In every difficulty lies opportunity. - Albert Einstein",
-"In order to succeed, we must first believe that we can. - Nikos Kazantzakis",
-"In the middle of difficulty lies opportunity. - Albert Einstein",
-"In this life we cannot do great things. We can only do small things with great love. - Mother Teresa",
-"Inspiration exists, but it must find you working. - Pablo Picasso",
-"It always seems impossible until it's done. - Nelson Mandela",
-"It does not matter how slowly you go as long as you do not stop. - Confucius",
-"It is always the simple that produces the marvelous. - Amelia Barr",
-"It is during our darkest moments that we must focus to see the light. - Aristotle",
-"It is never too late to be what you might have been. - George Eliot",
-"It is not what you do for your children, but what you have taught them to do for themselves, that will make them successful human beings. - Ann Landers",
-"It is not where you start but how high you aim that matters for success. - Nelson Mandela",
-"It’s not whether you get knocked down. It’s whether you get up again. - Vince Lombardi",
-"Judge each day not by the harvest you reap but by the seeds you plant. - Robert Louis Stevenson",
-"Just when the caterpillar thought the world was ending, he turned into a butterfly. - Proverb",
-"Keep your eyes on the stars, and your feet on the ground. - Theodore Roosevelt",
-"Leadership is the capacity to translate vision into reality. - Warren Bennis",
-"Learn from the past, set vivid, detailed goals for the future, and live in the only moment of time over which you have any control: now. - Denis Waitley",
-"Learning is the beginning of wealth. Learning is the beginning of health. Learning is the beginning of spirituality. Searching and learning is where the miracle process all begins. - Jim Rohn",
-"Let the beauty of what you love be what you do. - Rumi",
-"Let us sacrifice our today so that our children can have a better tomorrow. - A. P. J. Abdul Kalam",
-"Life is 10% what happens to me and 90% of how I react to it. - Charles Swindoll",
-"Life is about making an impact, not making an income. - Kevin Kruse",
-"Life is not measured by the number of breaths we take, but by the moments that take our breath away. - Maya Angelou",
-"Life isn't about getting and having, it's about giving and being. - Kevin Kruse",
-"Life shrinks or expands in proportion to one's courage. - Anais Nin",
-"Listen with curiosity. Speak with honesty. Act with integrity. The greatest problem with communication is we don’t listen to understand. We listen to reply. When we listen with curiosity, we don’t listen with the intent to reply. We listen for what’s behind the words. - Roy T. Bennett",
-"Little minds are tamed and subdued by misfortune; but great minds rise above it. - Washington Irving",
-"Look at the sparrows; they do not know what they will do in the next moment. Let us literally live from moment to moment. - Mahatma Gandhi",
-"Lost time is never found again. - Benjamin Franklin",
-"Love the life you live. Live the life you love. - Bob Marley",
-"Make each day your masterpiece. - John Wooden",
-"Many of life's failures are people who did not realize how close they were to success when they gave up. - Thomas A. Edison",
-"Money and success don’t change people; they merely amplify what is already there. - Will Smith",
-"Most of the important things in the world have been accomplished by people who have kept on trying when there seemed to be no help at all. - Dale Carnegie",
-"Motivation is what gets you started. Habit is what keeps you going. - Jim Rohn",
-"Move out of your comfort zone. You can only grow if you are willing to feel awkward and uncomfortable when you try something new. - Brian Tracy",
-"My mission in life is not merely to survive, but to thrive; and to do so with some passion, some compassion, some humor, and some style. - Maya Angelou",
-"Never complain and never explain. - Benjamin Disraeli",
-"Never give up, for that is just the place and time that the tide will turn. - Harriet Beecher Stowe",
-"Never, never, never give up. - Winston Churchill",
-"No matter what people tell you, words and ideas can change the world. - Robin Williams",
-"No one can make you feel inferior without your consent. - Eleanor Roosevelt",
-"No one who achieves success does so without the help of others. The wise and confident acknowledge this help with gratitude. - Alfred North Whitehead",
-"Nothing is impossible, the word itself says 'I'm possible'! - Audrey Hepburn",
-"Nothing will work unless you do. - Maya Angelou",
-"Ones best success comes after their greatest disappointments. - Henry Ward Beecher",
-"Only I can change my life. No one can do it for me. - Carol Burnett",
-"Opportunities are usually disguised as hard work, so most people don't recognize them. - Ann Landers",
-"Opportunities don't happen, you create them. - Chris Grosser",
-"Opportunity does not knock, it presents itself when you beat down the door. - Kyle Chandler",
-"Our lives begin to end the day we become silent about things that matter. - Martin Luther King Jr.",
-"People often say that motivation doesn't last. Well, neither does bathing. That's why we recommend it daily. - Zig Ziglar",
-"People who are crazy enough to think they can change the world, are the ones who do. - Rob Siltanen",
-"Perfection is not attainable, but if we chase perfection we can catch excellence. - Vince Lombardi",
-"Practice Golden Rule management in everything you do. Manage others the way you would like to be managed. - Brian Tracy",
-"Problems are not stop signs, they are guidelines. - Robert H. Schuller",
-"Put your heart, mind, and soul into even your smallest acts. This is the secret of success. - Swami Sivananda",
-"Quality is not an act, it is a habit. - Aristotle",
-"Reach for the stars so if you fall you land on a cloud. - Kanye West",
-"Real difficulties can be overcome; it is only the imaginary ones that are unconquerable. - Theodore N. Vail",
-"Remember no one can make you feel inferior without your consent. - Eleanor Roosevelt",
-"Set your goals high, and don't stop till you get there. - Bo Jackson",
-"Setting goals is the first step in turning the invisible into the visible. - Tony Robbins",
-"Small daily improvements are the key to staggering long-term results. - Unknown",
-"Someone sits in the shade today because someone planted a tree a long time ago. - Warren Buffett",
-"Sometimes when you innovate, you make mistakes. It is best to admit them quickly, and get on with improving your other innovations. - Steve Jobs",
-"Start where you are. Use what you have. Do what you can. - Arthur Ashe",
-"Strive not to be a success, but rather to be of value. - Albert Einstein",
-"Success consists of getting up just one more time than you fall. - Oliver Goldsmith",
-"Success is dependent on effort. - Sophocles",
-"Success is not final, failure is not fatal: it is the courage to continue that counts. - Winston Churchill",
-"Success is the sum of small efforts - repeated day in and day out. - Robert Collier",
-"Success usually comes to those who are too busy to be looking for it. - Henry David Thoreau",
-"Take up one idea. Make that one idea your life--think of it, dream of it, live on that idea. Let the brain, muscles, nerves, every part of your body, be full of that idea, and just leave every other idea alone. This is the way to success. - Swami Vivekananda",
-"Tell me and I forget. Teach me and I remember. Involve me and I learn. - Benjamin Franklin",
-"The art of living lies less in eliminating our troubles than in growing with them. - Bernard M. Baruch",
-"The best preparation for tomorrow is doing your best today. - H. Jackson Brown, Jr.",
-"The best revenge is massive success. - Frank Sinatra",
-"The best time to plant a tree was 20 years ago. The second best time is now. - Chinese Proverb",
-"The best way out is always through. - Robert Frost",
-"The difference between who you are and who you want to be is what you do. - Unknown",
-"The first step toward success is taken when you refuse to be a captive of the environment in which you first find yourself. - Mark Caine",
-"The future belongs to those who believe in the beauty of their dreams. - Eleanor Roosevelt",
-"The harder the battle the sweeter the victory. - Les Brown",
-"The journey of a thousand miles begins with one step. - Lao Tzu",
-"The mind is everything. What you think you become. - Buddha",
-"The more man meditates upon good thoughts, the better will be his world and the world at large. - Confucius",
-"The most common way people give up their power is by thinking they don't have any. - Alice Walker",
-"The most difficult thing is the decision to act, the rest is merely tenacity. - Amelia Earhart",
-"The only person you are destined to become is the person you decide to be. - Ralph Waldo Emerson",
-"The only place where success comes before work is in the dictionary. - Vidal Sassoon",
-"The only thing that overcomes hard luck is hard work. - Harry Golden",
-"The only thing worse than being blind is having sight but no vision. - Helen Keller",
-"The only way to do great work is to love what you do. - Steve Jobs",
-"The person who says it cannot be done should not interrupt the person who is doing it. - Chinese Proverb",
-"The real test is not whether you avoid this failure, because you won't. It's whether you let it harden or shame you into inaction, or whether you learn from it; whether you choose to persevere. - Barack Obama",
-"The road to success and the road to failure are almost exactly the same. - Colin R. Davis",
-"The secret of joy in work is contained in one word - excellence. To know how to do something well is to enjoy it. - Pearl Buck",
-"The secret of success is to do the common thing uncommonly well. - John D. Rockefeller Jr.",
-"The starting point of all achievement is desire. - Napoleon Hill",
-"The successful warrior is the average man, with laser-like focus. - Bruce Lee",
-"The way to get started is to quit talking and begin doing. - Walt Disney",
-"The whole secret of a successful life is to find out what is one's destiny to do, and then do it. - Henry Ford",
-"There are no limits to what you can accomplish, except the limits you place on your own thinking. - Brian Tracy",
-"There are no secrets to success. It is the result of preparation, hard work, and learning from failure. - Colin Powell",
-"There is no passion to be found playing small - in settling for a life that is less than the one you are capable of living. - Nelson Mandela",
-"There is only one way to avoid criticism: do nothing, say nothing, and be nothing. - Aristotle",
-"There's a way to do it better - find it. - Thomas A. Edison",
-"Things work out best for those who make the best of how things work out. - John Wooden",
-"Think with your whole body. - Taisen Deshimaru",
-"Those who say it can not be done, should not interrupt those doing it. - Chinese Proverb",
-"Though no one can go back and make a brand new start, anyone can start from now and make a brand new ending. - Carl Bard",
-"To accomplish great things, we must not only act, but also dream, not only plan, but also believe. - Anatole France",
-"To know how much there is to know is the beginning of learning to live. - Dorothy West",
-"To succeed in life, you need two things: ignorance and confidence. - Mark Twain",
-"Today’s accomplishments were yesterday’s impossibilities. - Robert H. Schuller",
-"Too many of us are not living our dreams because we are living our fears. - Les Brown",
-"Try not to become a man of success. Rather become a man of value. - Albert Einstein",
-"Twenty years from now you will be more disappointed by the things that you didn't do than by the ones you did do, so throw off the bowlines, sail away from safe harbor, catch the trade winds in your sails. Explore, Dream, Discover. - Mark Twain",
-"Two roads diverged in a wood, and I took the one less traveled by, and that has made all the difference. - Robert Frost",
-"We all have ability. The difference is how we use it. - Stevie Wonder",
-"We become what we think about. - Earl Nightingale",
-"We can do anything we want to if we stick to it long enough. - Helen Keller",
-"We can easily forgive a child who is afraid of the dark; the real tragedy of life is when men are afraid of the light. - Plato",
-"We can't help everyone, but everyone can help someone. - Ronald Reagan",
-"We generate fears while we sit. We overcome them by action. - Dr. Henry Link",
-"We must believe that we are gifted for something, and that this thing, at whatever cost, must be attained. - Marie Curie",
-"Weak people revenge. Strong people forgive. Intelligent people ignore. - Albert Einstein",
-"What seems to us as bitter trials are often blessings in disguise. - Oscar Wilde",
-"What you get by achieving your goals is not as important as what you become by achieving your goals. - Zig Ziglar",
-"What you lack in talent can be made up with desire, hustle and giving 110% all the time. - Don Zimmer",
-"Whatever the mind of man can conceive and believe, it can achieve. - Napoleon Hill",
-"Whatever you can do, or dream you can, begin it. Boldness has genius, power and magic in it. - Johann Wolfgang von Goethe",
-"Whatever you vivdly imagine, ardently desire, sincerely believe, and enthusiastically act upon... must inevitably come to pass! - Paul J. Meyer",
-"When everything seems to be going against you, remember that the airplane takes off against the wind, not with it. - Henry Ford",
-"When I let go of what I am, I become what I might be. - Lao Tzu",
-"When one door of happiness closes, another opens, but often we look so long at the closed door that we do not see the one that has been opened for us. - Helen Keller",
-"When we strive to become better than we are, everything around us becomes better too. - Paulo Coelho",
-"When you reach the end of your rope, tie a knot in it and hang on. - Franklin D. Roosevelt",
-"Whenever you see a successful business, someone once made a courageous decision. - Peter F. Drucker",
-"Whenever you see a successful person you only see the public glories, never the private sacrifices to reach them. - Vaibhav Shah",
-"Whether you think you can or you think you can't, you're right. - Henry Ford",
-"Who sows virtue reaps honor. - Leonardo da Vinci",
-"Winning isn't everything, but wanting to win is. - Vince Lombardi",
-"Without hard work, nothing grows but weeds. - Gordon B. Hinckley",
-"Work to become, not to acquire. - Elbert Hubbard",
-"You are never too old to set another goal or to dream a new dream. - C. S. Lewis",
-"You become what you believe. - Oprah Winfrey",
-"You can never cross the ocean until you have the courage to lose sight of the shore. - Christopher Columbus",
-"You can't build a reputation on what you are going to do. - Henry Ford",
-"You can't cross the sea merely by standing and staring at the water. - Rabindranath Tagore",
-"You can't use up creativity. The more you use, the more you have. - Maya Angelou",
-"You have to learn the rules of the game. And then you have to play better than anyone else. - Albert Einstein",
-"You may be disappointed if you fail, but you are doomed if you don't try. - Beverly Sills",
-"You miss 100% of the shots you don't take. - Wayne Gretzky",
-"You must be the change you wish to see in the world. - Mahatma Gandhi",
-"You never know what motivates you. - Cicely Tyson",
-"Your imagination is your preview of life's coming attractions. - Albert Einstein",
-"Your time is limited, so don't waste it living someone else's life. - Steve Jobs",
-"Your work is going to fill a large part of your life, and the only way to be truly satisfied is to do what you believe is great work. And the only way to do great work is to love what you do. If you haven't found it yet, keep looking. Don't settle. As with all matters of the heart, you'll know when you find it. - Steve Jobs",
-"All our dreams can come true, if we have the courage to pursue them. - Walt Disney",
-"The secret of getting ahead is getting started. - Mark Twain",
-"I’ve missed more than 9,000 shots in my career. I’ve lost almost 300 games. 26 times I’ve been trusted to take the game winning shot and missed. I’ve failed over and over and over again in my life and that is why I succeed. - Michael Jordan",
-"Don’t limit yourself. Many people limit themselves to what they think they can do. You can go as far as your mind lets you. What you believe, remember, you can achieve. - Mary Kay Ash",
-"Only the paranoid survive. - Andy Grove",
-"It’s hard to beat a person who never gives up. - Babe Ruth",
-"I wake up every morning and think to myself, ‘How far can I push this company in the next 24 hours?’ - Leah Busque",
-"We need to accept that we won’t always make the right decisions, that we’ll screw up royally sometimes―understanding that failure is not the opposite of success, it’s part of success. - Arianna Huffington",
-"Write it. Shoot it. Publish it. Crochet it. Sauté it. Whatever. MAKE. - Joss Whedon",
-"If people are doubting how far you can go, go so far that you can’t hear them anymore. - Michele Ruiz",
-"You’ve gotta dance like there’s nobody watching, love like you’ll never be hurt, sing like there’s nobody listening, and live like it’s heaven on earth. - William W. Purkey",
-"Fairy tales are more than true: not because they tell us that dragons exist, but because they tell us that dragons can be beaten. - Neil Gaiman",
-"When one door of happiness closes, another opens; but often we look so long at the closed door that we do not see the one which has been opened for us. - Helen Keller",
-"Do one thing every day that scares you. - Eleanor Roosevelt",
-"It’s no use going back to yesterday, because I was a different person then. - Lewis Carroll",
-"Smart people learn from everything and everyone, average people from their experiences, stupid people already have all the answers. - Socrates",
-"Do what you feel in your heart to be right―for you’ll be criticized anyway. - Eleanor Roosevelt",
-"Happiness is not something ready made. It comes from your own actions. - Dalai Lama XIV",
-"Whatever you are, be a good one. - Abraham Lincoln",
-"Imagination is everything. It is the preview of life's coming attractions. - Albert Einstein",
-"If we have the attitude that it’s going to be a great day it usually is. - Catherine Pulsifier",
-"You can either experience the pain of discipline or the pain of regret. The choice is yours. - Unknown",
-"Impossible is just an opinion. - Paulo Coelho",
-"Your passion is waiting for your courage to catch up. - Isabelle Lafleche",
-"Magic is believing in yourself. If you can make that happen, you can make anything happen. - Johann Wolfgang Von Goethe",
-"If something is important enough, even if the odds are stacked against you, you should still do it. - Elon Musk",
-"Hold the vision, trust the process. - Unknown",
-"People who wonder if the glass is half empty or full miss the point. The glass is refillable. - Unknown",
-"It’s Monday … time to motivate and make dreams and goals happen. Let’s go! - Heather Stillufsen",
-"It was a Monday and they walked on a tightrope to the sun. - Marcus Zusak",
-"Goodbye, blue Monday. - Kurt Vonnegut",
-"So. Monday. We meet again. We will never be friends—but maybe we can move past our mutual enmity toward a more positive partnership. - Julio-Alexi Genao",
-"When life gives you Monday, dip it in glitter and sparkle all day. - Ella Woodword",
-"All Motivation Mondays need are a little more coffee and a lot more mascara. - Unknown",
-"I’m alive, motivated and ready to slay the day #MONSLAY. - Unknown",
-"Oh! It’s Friday again. Share the love that was missing during the week. In a worthy moment of peace and bliss. - S. O’Sade",
-"Friday sees more smiles than any other day of the workweek! - Kate Summers",
-"Every Friday, I like to high five myself for getting through another week on little more than caffeine, willpower, and inappropriate humor. - Nanea Hoffman",
-"When you leave work on Friday, leave work. Don’t let technology follow you throughout your weekend (answering text messages and emails). Take a break. You will be more refreshed to begin the workweek if you have had a break. - Catherine Pulsifer",
-"Make a Friday a day to celebrate work well done that you can be proud of knowing that you just didn’t put in time to the next paycheck. - Byron Pulsifer",
-"Although I understand that all days are equal with 24 hours each, most of us agree that Friday is the longest day of the week and Sunday the shortest. - D.S. Mixell",
-"This Friday, finish your work and be done. Look forward to the weekend and have some fun! - Kate Summers",
-"Friday. The golden child of the weekdays. The superhero of the workweek. The welcome wagon to the weekend. - Unknown",
-"Happy Wednesday! Cast your love to all, trust in the team to which you are joined, and provide encouragement to fellow human beings. - Byron Pulsifer",
-"Happy Wednesday! You are who you are; be happy with what you are called to do. Do not pretend to be like someone else for your gifts are unique to help lead you to the success as only you can define. Have a good day. - Byron Pulsifer",
-"Happy Wednesday! Love all, trust a few, do wrong to none. - William Shakespeare",
-"Happy Wednesday! Happiness is an attitude. We either make ourselves miserable, or happy and strong. The amount of work is the same. - Unknown",
-"Wednesdays will always bring smiles for the second half of the week. - Anthony T. Hincks",
-"To some, it’s Hump Day. To us, it’s Wednesday’s getting its ass kicked and Thursday just asking Friday to switch places. - Dwayne Johnson",
-"Wednesday: Halfway to the weekend! Enjoy your day! - Unknown",
-"On Wednesday they’re feelin’ fine again. - Johnny Cash",
-"Happy Thursday! Greet your problems and decisions with peace and calm. Use your inner wisdom to evaluate and make smart decisions for yourself! You got this! - Tracey Edmonds",
-"Some people call it Thursday, I like to call it Friday Eve. - Unknown",
-"Happy Thursday! Change your life today; don’t gamble on the future, act now, without delay. - Simone de Beauvoir",
-"Thursday, I forecast as mostly sunny. It’s a much-needed break. - John Farley",
-"Thursday is perhaps the worst day of the week. It’s nothing in itself; it just reminds you that the week has been going on too long. - Nicci French",
-"Thursday is my favorite day to plan how I’m going to get out of the plans I already made for the weekend. - Unknown",
-"Make your snacks on Sunday, and plan to cook with your family for at least two nights a week. - Anya Taylor-Joy",
-"Sunday clears away the rust of the whole week. - Joseph Addison",
-"Sunday is the perfect day to refuel your soul and to be grateful for each and every one of your blessings. - Unknown",
-"Sunday is a perfect day to choose a new path in life, don’t be afraid of changes, they come when they are really needed. Have a wonderful Sunday. - Unknown",
-"Well, there’s one thing to be said for Sunday. It’s the day when we can all take a break from the hectic pace of the week and just relax. Enjoy your Sunday! - Unknown",
-"Sunday is a day to clear the mind of all that has transpired the week before. - Byron Pulsifer",
-"The frantic pace of the week can take its toll, but Sunday is a day to recharge the batteries and prepare for the challenges ahead. - Unknown",
-"Saturday is a day to enjoy the fruits of your labor from the week, to spend time with family and friends, and to recharge for the week ahead. - Unknown",
-"On Saturday, we can all take a much-needed break from the stresses of the work week and just enjoy some time for ourselves. - Unknown",
-"Saturday is a day to relax and recharge, to spend time with loved ones, and to do the things that make you happy. - Unknown",
-"Saturday is the perfect day to do nothing and everything all at the same time. - Unknown",
-"The weekend is a time to recharge your batteries, spend time with loved ones, and do the things you love. - Unknown",
-"The weekend is finally here! Time to relax and enjoy yourself. - Unknown",
-"Weekends are a bit like rainbows; they look good from a distance but disappear when you get up close to them. - John Shirley",
-"The weekend is the perfect time to recharge your batteries and forget about all your worries. - Unknown",
-"Weekends don’t count unless you spend them doing something completely pointless. - Bill Watterson",
-"It’s a new day. I’m alive. I’m blessed. God is good. God is great. Have a blessed day! - Unknown",
-"A good day is a good day. A bad day is a good story. - Glennon Melton",
-"Any day above ground is a good day. Before you complain about anything, be thankful for your life and the things that are still with good. - Germany Kent",
-"Every day is a good day to be alive, whether the sun’s shining or not. - Marty Robbins",
-"I get up every morning and it’s going to be a good day. You never know when it’s going to be over, so I refuse to have a bad day. - Paul Henderson",
-"It was a good day to be alive. It usually is. - Stephen King",
-"It’s a good day for a good day. - Unknown",
-"Every single day is a good day no matter how bright or dark it is, because it always brings an opportunity to start a positive beginning in your life. - Edmond Mbiaka",
-"Today is a good day to have a great day! - Unknown",
-"Today’s a good day to have a good day. - Unknown",
-"Don’t live your life regretting yesterday. Live your life so tomorrow won’t be full of regrets. - Unknown",
-"You have to remember that the hard days are what make you stronger. The bad days make you realize what a good day is. If you never had any bad days, you would never have that sense of accomplishment! - Aly Raisman",
-"When you’re wide awake, say it for goodness sake, it’s gonna be a great day. - Paul McCartney",
-"We don’t have a great day, we make it a great day. - Frosty Westering",
-"On a good day, when you have a clear plan, you are able to execute whatever you wanted. - Jasprit Bumrah",
-"It’s time to start living the life you’ve imagined. - Henry James",
-"Love. Fall in love and stay in love. Write only what you love, and love what you write. The key word is love. You have to get up in the morning and write something you love, something to live for. - Ray Bradbury",
-"I hope everyone that is reading this is having a really good day. And if you are not, just know that in every new minute that passes you have an opportunity to change that. - Gillian Anderson",
-"I just want people to take a step back, take a deep breath and actually look at something with a different perspective. But most people will never do that. - Brian McKnight",
-"Even if you're on the right track, you'll get run over if you just sit there. - Will Rogers",
-"Life is like riding a bicycle. To keep your balance, you must keep moving. - Albert Einstein",
-"Nothing is impossible, the word itself says, 'I'm possible!' - Audrey Hepburn",
-"The only thing worse than starting something and failing … is not starting something. - Seth Godin",
-"Life changes very quickly, in a very positive way, if you let it. - Lindsey Vonn",
-"If you don't like the road you're walking, start paving another one. - Dolly Parton",
-"All great ideas start as weird ideas. - Unknown",
-"You can’t have a better tomorrow if you are thinking about yesterday all the time. - Charles Kettering",
-"What you do makes a difference, and you have to decide what kind of difference you want to make. - Jane Goodall",
-"Being a successful person is not necessarily defined by what you have achieved, but by what you have overcome. - Fannie Flagg",
-"Failure is the condiment that gives success its flavor. - Truman Capote",
-"If you know you are on the right track, if you have this inner knowledge, then nobody can turn you off… no matter what they say. - Barbara McClintock",
-"I learned a long time ago that there is something worse than missing the goal, and that’s not pulling the trigger. - Mia Hamm",
-"You cannot be lonely if you like the person you're alone with. - Wayne Dyer",
-"No one is to blame for your future situation but yourself. If you want to be successful, then become 'Successful.' - Jaymin Shah",
-"Opportunity is missed by most people because it is dressed in overalls and looks like work. - Thomas Edison",
-"Yesterday’s home runs don't win today's games. - Babe Ruth",
-"The only real mistake is the one from which we learn nothing. - Henry Ford",
-"The successful man will profit from his mistakes and try again in a different way. - Dale Carnegie",
-"Success is a lousy teacher. It seduces smart people into thinking they can’t lose. - Bill Gates",
-"Failure is success in progress. - Albert Einstein",
-"The difference between successful people and others is how long they spend feeling sorry for themselves. - Barbara Corcoran",
-"The only thing that overcomes hard luck is hard work. - Harry Golden",
-"Your positive action combined with positive thinking results in success. - Shiv Khera",
-"Success is getting what you want, happiness is wanting what you get. - W. P. Kinsella",
-"Success is dependent on effort. - Sophocles",
-"The successful warrior is the average man, with laser-like focus. - Bruce Lee",
-"If you really look closely, most overnight successes took a long time. - Steve Jobs",
-"Self-belief and hard work will always earn you success. - Virat Kohli",
-"Success is how high you bounce when you hit bottom. - George S. Patton",
-"Success usually comes to those who are too busy to be looking for it. - Henry David Thoreau",
-"Success seems to be connected with action. Successful people keep moving. They make mistakes but they don't quit. - Conrad Hilton",
-"Success is not in what you have, but who you are. - Bo Bennett",
-"The difference between who you are and who you want to be is what you do. - Unknown",
-"Success is liking yourself, liking what you do, and liking how you do it. - Maya Angelou",
-"Success is stumbling from failure to failure with no loss of enthusiasm. - Winston S. Churchill",
-"Success is not the key to happiness. Happiness is the key to success. If you love what you are doing, you will be successful. - Albert Schweitzer",
-"Success is a state of mind. If you want success, start thinking of yourself as a success. - Joyce Brothers",
-"Success comes from knowing that you did your best to become the best that you are capable of becoming. - John Wooden",
-"The secret of success is to do the common thing uncommonly well. - John D. Rockefeller Jr.",
-"Success is the sum of small efforts - repeated day in and day out. - Robert Collier",
-"Success is not final; failure is not fatal: It is the courage to continue that counts. - Winston S. Churchill",
-"The road to success and the road to failure are almost exactly the same. - Colin R. Davis",
-"Don’t be distracted by criticism. Remember — the only taste of success some people get is to take a bite out of you. - Zig Ziglar",
-"Success is only meaningful and enjoyable if it feels like your own. - Michelle Obama",
-"I never dreamed about success. I worked for it. - Estée Lauder",
-"The only thing standing between you and outrageous success is continuous progress. - Dan Waldschmidt",
-"Success is the result of perfection, hard work, learning from failure, loyalty, and persistence. - Colin Powell",
-"Coming together is a beginning; keeping together is progress; working together is success. - Edward Everett Hale",
-"Ambition is the path to success. Persistence is the vehicle you arrive in. - Bill Bradley",
-"If you really want to do something, you'll find a way. If you don't, you'll find an excuse. - Jim Rohn",
-"A successful man is one who can lay a firm foundation with the bricks others have thrown at him. - David Brinkley",
-"The successful man will profit from his mistakes and try again in a different way. - Dale Carnegie",
-"Success is peace of mind which is a direct result of self-satisfaction in knowing you did your best to become the best you are capable of becoming. - John Wooden",
-"Success is best when it's shared. - Howard Schultz",
-"Success is a journey not a destination. - Ben Sweetland",
-"Success? I don't know what that word means. I'm happy. But success, that goes back to what in somebody's eyes success means. For me, success is inner peace. That's a good day for me. - Denzel Washington",
-"Success is often achieved by those who don't know that failure is inevitable. - Coco Chanel",
-"Choose a job you love, and you will never have to work a day in your life. - Confucius",
-"Success in business requires training and discipline and hard work. But if you’re not frightened by these things, the opportunities are just as great today as they ever were. - David Rockefeller",
-"To be successful, you have to have your heart in your business, and your business in your heart. - Thomas Watson Sr.",
-"Success is about creating value. - Candice Carpenter",
-"The secret of success in every field is redefining what success means to you. It can't be your parent's definition, the media's definition, or your neighbor's definition. Otherwise, success will never satisfy you. - RuPaul",
-"Strive not to be a success, but rather to be of value. - Albert Einstein",
-"Success isn't about how much money you make. It's about the difference you make in people's lives. - Michelle Obama",
-"Success is going from failure to failure without losing enthusiasm. - Winston Churchill",
-"The secret of success is constancy to purpose. - Benjamin Disraeli",
-"The only place where success comes before work is in the dictionary. - Vidal Sassoon",
-"Success is 99 percent failure. - Soichiro Honda",
-"If you have no critics you'll likely have no success. - Malcolm X",
-"Living our life deeply and with happiness, having time to care for our loved ones, this is another kind of success, another kind of power, and it is much more important. - Thich Nhat Hanh",
-"Success isn't always about greatness. It's about consistency. Consistent hard work leads to success. Greatness will come. - Dwayne Johnson",
-"The biggest challenge after success is shutting up about it. - Criss Jami",
-"Applause waits on success. - Benjamin Franklin",
-"Nothing succeeds like success. - Alexandre Dumas",
-"We must walk consciously only part way toward our goal, and then leap in the dark to our success. - Henry David Thoreau",
-"The difference between successful people and very successful people is that very successful people say 'no' to almost everything. - Warren Buffett",
-"One important key to success is self-confidence. An important key to self-confidence is preparation. - Arthur Ashe",
-"Success comes in cans; failure in can'ts. - Wilfred Peterson",
-"However difficult life may seem, there is always something you can do and succeed at. - Stephen Hawking",
-"He has achieved success who has lived well, laughed often and loved much. - Bessie Anderson Stanley",
-"Measure your success according to fun and creativity. - Anita Roddick",
-"Sitting quietly, doing nothing, Spring comes and the grass grows, by itself. - Basho",
-"If you want to live a happy life, tie it to a goal, not to people or things. - Albert Einstein",
-"The whole secret of a successful life is to find out what is one's destiny to do, and then do it. - Henry Ford",
-"If you want to be happy, set a goal that commands your thoughts, liberates your energy, and inspires your hopes. - Andrew Carnegie",
-"Happiness cannot be traveled to, owned, earned, worn, or consumed. Happiness is the spiritual experience of living every minute with love, grace, and gratitude. - Denis Waitley",
-"It is only when we take chances, when our lives improve. The initial and the most difficult risk that we need to take is to become honest. - Walter Anderson",
-"Only put off until tomorrow what you are willing to die having left undone. - Pablo Picasso",
-"We become what we think about most of the time, and that's the strangest secret. - Earl Nightingale",
-"The only place where success comes before work is in the dictionary. - Vidal Sassoon",
-"Though no one can go back and make a brand-new start, anyone can start from now and make a brand-new ending. - Carl Bard",
-"Don't let yesterday take up too much of today's. - Will Rogers",
-"The pessimist sees difficulty in every opportunity. The optimist sees opportunity in every difficulty. - Winston Churchill",
-"If you are working on something that you really care about, you don’t have to be pushed. The vision pulls you. - Steve Jobs",
-"If you can't explain it simply, you don't understand it well enough. - Albert Einstein",
-"People often say that motivation doesn't last. Well, neither does bathing--that's why we recommend it daily. - Zig Ziglar",
-"Working hard for something we don't care about is called stressed; working hard for something we love is called passion. - Simon Sinek",
-"I’d rather regret the things I’ve done than regret the things I haven’t done. - Lucille Ball",
-"I didn't get there by wishing for it or hoping for it, but by working for it. - Estée Lauder",
-"Always do your best. What you plant now, you will harvest later. - Og Mandino",
-"The key to life is accepting challenges. Once someone stops doing this, he's dead. - Bette Davis",
-"Move out of your comfort zone. You can only grow if you are willing to feel awkward and uncomfortable when you try something new. - Brian Tracy",
-"Challenges are what make life interesting and overcoming them is what makes life meaningful. - Joshua J. Marine",
-"Don't let the fear of losing be greater than the excitement of winning. - Robert Kiyosaki",
-"How dare you settle for less when the world has made it so easy for you to be remarkable? - Seth Godin",
-"Energy and persistence conquer all things. - Benjamin Franklin",
-"Perseverance is failing 19 times and succeeding the 20th. - Julie Andrews",
-"Grit is that ‘extra something' that separates the most successful people from the rest. It's the passion, perseverance, and stamina that we must channel in order to stick with our dreams until they become a reality. - Travis Bradberry",
-"Failure after long perseverance is much grander than never to have a striving good enough to be called a failure. - George Eliot",
-"The secret of success is to do the common thing uncommonly well. - John D. Rockefeller Jr.",
-"I find that the harder I work, the more luck I seem to have. - Thomas Jefferson",
-"If you are not willing to risk the usual, you will have to settle for the ordinary. - Jim Rohn",
-"All progress takes place outside the comfort zone. - Michael John Bobak",
-"Don't wish it were easier, wish you were better. - Jim Rohn",
-"It is your determination and persistence that will make you a successful person. - Kenneth J Hutchins",
-"You can waste your lives drawing lines. Or you can live your life crossing them. - Shonda Rhimes",
-"If you really want to do it, you do it. There are no excuses. - Bruce Nauman",
-"Determine that the thing can and shall be done, and then we shall find the way. - Abraham Lincoln",
-"Be sure you put your feet in the right place, then stand firm. - Abraham Lincoln",
-"I don't want to get to the end of my life and find that I lived just the length of it. I want to have lived the width of it as well. - Diane Ackerman",
-"Motivation is what gets you started. Habit is what keeps you going. - Jim Rohn",
-"You must expect great things of yourself before you can do them. - Michael Jordan",
-"You don't have to see the whole staircase, just take the first step. - Martin Luther King Jr.",
-"Don't stop when you're tired. Stop when you're done. - Unknown",
-"You may have to fight a battle more than once to win it. - Margaret Thatcher",
-"Dream as if you'll live forever, live as if you'll die today. - James Dean",
-"The difference between the impossible and the possible lies in a person's determination. - Tommy Lasorda",
-"To be a champion, I think you have to see the big picture. - Summer Sanders",
-"Obsessed is the word the lazy use to describe dedicated. - Russell Warren",
-"If we didn't do what we loved, we wouldn't exist. - Adonis",
-"If it doesn't challenge you, it won't change you. - Unknown",
-"The greater the difficulty, the more the glory in surmounting it. - Epicurus",
-"We can do anything we want to if we stick to it long enough. - Helen Keller",
-"It isn't the mountains ahead to climb that wear you out; it's the pebble in your shoe. - Muhammad Ali",
-"If your actions inspire others to dream more, learn more, do more and become more, you are a leader. - John Quincy Adams",
-"Don't be afraid to give up the good to go for the great. - John D. Rockefeller",
-"Our greatest glory is not in never falling, but in rising every time we fall. - Confucius",
-"All you need is the plan, the road map, and the courage to press on to your destination. - Earl Nightingale",
-"Though no one can go back and make a brand new start, anyone can start from now and make a brand new ending. - Carl Bard",
-"Don't be pushed by your problems; be led by your dreams. - Unknown",
-"Don't mistake activity with achievement. - John Wooden",
-"One day or day one. You decide. - Unknown",
-"What we fear doing most is usually what we most need to do. - Tim Ferriss",
-"Impossible is for the unwilling. - John Keats",
-"No pressure, no diamonds. - Thomas Carlyle",
-"Believe you can and you're halfway there. - Theodore Roosevelt",
-"Stay close to anything that makes you glad you are alive. - Hafez",
-"You do not find the happy life. You make it. - Camilla Eyring Kimball",
-"You have brains in your head. You have feet in your shoes. You can steer yourself any direction you choose. - Dr. Seuss",
-"If there is no wind, row. - Latin Proverb",
-"Keep your face always toward the sunshine—and shadows will fall behind you. - Walt Whitman",
-"Make each day your masterpiece. - John Wooden",
-"Your time is limited, so don’t waste it living someone else’s life. - Steve Jobs",
-"The best revenge is massive success. - Frank Sinatra",
-"Don't wait. The time will never be just right. - Napoleon Hill",
-"Happiness is not by chance, but by choice. - Jim Rohn",
-"Life changes very quickly, in a very positive way, if you let it. - Lindsey Vonn",
-"Keep calm and carry on. - Winston Churchill",
-"There is nothing impossible to they who will try. - Alexander the Great",
-"Keep your face to the sunshine and you can not see a shadow. - Unknown",
-"In a gentle way, you can shake the world. - Mahatma Gandhi",
-"Let your soul stand cool and composed before a million universe. - Walt Whitman",
-"The real difficulty is to overcome how you think about yourself. - Maya Angelou",
-"Turn your wounds into wisdom. - Oprah Winfrey",
-"Wherever you go, go with all your heart. - Confucius",
-"We can do anything we want to if we stick to it long enough. - Helen Keller",
-"Begin anywhere. - John Cage",
-"I choose to make the rest of my life the best of my life. - Louise Hay",
-"Nothing can dim the light that shines from within. - Maya Angelou",
-"Be so good they can’t ignore you. - Steve Martin",
-"Take the risk or lose the chance. - Unknown",
-"Yesterday you said tomorrow. Just do it. - Nike",
-"The elevator to success is out of order. You’ll have to use the stairs, one step at a time. - Joe Girard",
-"Some people want it to happen, some wish it would happen, others make it happen. - Michael Jordan",
-"Don’t be afraid to give up the good to go for the great. - John D. Rockefeller",
-"Don’t quit. Suffer now and live the rest of your life as a champion. - Muhammad Ali",
-"A hill is just another opportunity to show that your determination and perseverance can level anything in your path to success. - Michelle C. Ustaszeski",
-"Don’t tell everyone your plans, instead show them your results. - Unknown",
-"We can do no great things, only small things with great love. - Mother Teresa",
-"I learned this, at least, by my experiment; that if one advances confidently in the direction of his dreams, and endeavors to live the life which he has imagined, he will meet with a success unexpected in common hours. - Henry David Thoreau",
-"Make it happen. Shock everyone. - Unknown",
-"Work hard and be kind and amazing things will happen. - Conan O’Brien",
-"Never stop doing your best just because someone doesn’t give you credit. - Kamari aka Lyrikal",
-"Work hard in silence, let your success be the noise. - Frank Ocean",
-"Work hard now. Suffer and sacrifice now. So that you can live the rest of your life as a champion. - Apolo Ohno",
-"Never stop learning, because life never stops teaching. - Unknown",
-"Winners are not people never fail, but people who never quit. - Unknown",
-"It takes nothing to join the crowd. It takes everything to stand alone. - Hans F. Hansen",
-"Your talent determines what you can do. Your motivation determines how much you’re willing to do. Your attitude determines how well you do it. - Lou Holtz",
-"The happiness of your life depends on the quality of your thoughts. - Marcus Aurelius",
-"Intelligence is the ability to adapt to change. - Stephen Hawking",
-"Leaders can let you fail and yet not let you be a failure. - Stanley McChrystal",
-"Would you like me to give you a formula for success? It’s quite simple, really: Double your rate of failure. You are thinking of failure as the enemy of success. But it isn’t at all. You can be discouraged by failure or you can learn from it, so go ahead and make mistakes. Make all you can. Because remember, that’s where you will find success. - Thomas J. Watson",
-"Be happy with what you have while working for what you want. - Helen Keller",
-"Sunshine all the time makes a desert. - Arabic proverb",
-"The big lesson in life is never be scared of anyone or anything. - Frank Sinatra",
-"I always wanted to be somebody, but now I realise I should have been more specific. - Lily Tomlin",
-"If you think you are too small to make a difference, try sleeping with a mosquito. - Dalai Lama",
-"Don't worry about failure. You only have to be right once. - Drew Houston",
-"You carry the passport to your own happiness. - Diane Von Furstenberg",
-"Never let success get to your head and never let failure get to your heart. - Drake",
-"The greatest discovery of my generation is that a human being can alter his life by altering his attitudes. - William James",
-"Anyone who has ever made anything of importance was disciplined. - Andrew Hendrixson",
-"Don’t spend time beating on a wall, hoping to transform it into a door. - Coco Chanel",
-"Optimism is the one quality more associated with success and happiness than any other. - Brian Tracy",
-"Always keep your eyes open. Keep watching. Because whatever you see can inspire you. - Grace Coddington",
-"What you get by achieving your goals is not as important as what you become by achieving your goals. - Henry David Thoreau",
-"If the plan doesn’t work, change the plan, but never the goal. - Unknown",
-"Don’t focus on negative things; focus on the positive, and you will flourish. - Alek Wek",
-"I surround myself with good people who make me feel great and give me positive energy. - Ali Krieger",
-"The only thing standing in the way between you and your goal is the BS story you keep telling yourself as to why you can’t achieve it. - Jordan Belfort",
-"The only thing worse than starting something and failing… is not starting something. - Seth Godin",
-"Don’t think, just do. - Horace",
-"Everything is learnable. - Brian Tracy",
-"Don’t worry about failure; you only have to be right once. - Drew Houston",
-"Life is like a movie, write your own ending. Keep believing, keep pretending. - Jim Henson",
-"Don’t talk, just act. Don’t say, just show. Don’t promise, just prove. - Unknown",
-"It does not matter how slowly you go so long as you do not stop. - Confucius",
-"Never confuse a single defeat with a final defeat. - F. Scott Fitzgerald",
-"Perseverance is not a long race; it is many short races one after another. - Walter Elliot",
-"Someone, at some point, came up with this very bad idea that an ordinary individual couldn't make a difference in the world. I think that's just a horrible thing. - John Skoll",
-"Work like there is someone working twenty-four hours a day to take it away from you. - Mark Cuban",
-"I am thankful for a problem grudge, for it can in no way be pleasing to me. - Unknown",
-"Be a positive energy tranceiver. Give everything you have to be your best, and good things will come. - Unknown",
-"You cannot plow a field by turning it over in your mind. To begin, begin. - Gordon B. Hinckley",
-"Give your dreams all you’ve got and you’ll be amazed at the energy that comes out of you. - William James",
-"Strength shows not only in the ability to persist, but in the ability to start over. - F. Scott Fitzgerald",
-"As long as you hate, there will be people to hate. - George Harrison",
-"Make sure your worst enemy doesn’t live between your own two ears. - Laird Hamilton",
-"It is a man’s own mind, not his enemy or foe, that lures him to evil ways. - Buddha",
-"The greatest weapon against stress is the ability to choose one thought over another. - William James",
-"Pessimism never won any battle. - Dwight D. Eisenhower",
-"If you hear a voice within you say 'you cannot paint,' then by all means paint, and that voice will be silenced. - Vincent van Gogh",
-"People begin to become successful the minute they decide to be. - Harvey MacKay",
-"Hold the vision, trust the process. - Unknown",
-"May your choices reflect your hopes, not your fears. - Nelson Mandela",
-"Don’t be pushed around by the fears in your mind. Be led by the dreams in your heart. - Roy T. Bennett",
-"Instead of worrying about what you cannot control, shift your energy to what you can create. - Roy T. Bennett",
-"Take responsibility of your own happiness, never put it in other people’s hands. - Roy T. Bennett",
-"Be mindful. Be grateful. Be positive. Be true. Be kind. - Roy T. Bennett",
-"Don’t waste your time in anger, regrets, worries, and grudges. Life is too short to be unhappy. - Roy T. Bennett",
-"Life becomes easier and more beautiful when we can see the good in other people. - Roy T. Bennett",
-"Success is not how high you have climbed, but how you make a positive difference to the world. - Roy T. Bennett",
-"Follow your heart, listen to your inner voice, stop caring about what others think. - Roy T. Bennett",
-"Start each day with a positive thought and a grateful heart. - Roy T. Bennett",
-"Be brave to stand for what you believe in even if you stand alone. - Roy T. Bennett",
-"Do what is right, not what is easy nor what is popular. - Roy T. Bennett",
-"If you have a strong purpose in life, you don’t have to be pushed. Your passion will drive you there. - Roy T. Bennett",
-"Always have a willing hand to help someone, you might be the only one that does. - Roy T. Bennett",
-"Strong people have a strong sense of self-worth and self-awareness; they don’t need the approval of others. - Roy T. Bennett",
-"Knowledge is being aware of what you can do. Wisdom is knowing when not to do it. - Anonymous",
-"Always remember people who have helped you along the way, and don’t forget to lift someone up. - Roy T. Bennett",
-"It’s only after you’ve stepped outside your comfort zone that you begin to change, grow, and transform. - Roy T. Bennett",
-"More smiling, less worrying. More compassion, less judgment. More blessed, less stressed. More love, less hate. - Roy T. Bennett",
-"Take responsibility of your own happiness, never put it in other people’s hands. - Roy T. Bennett",
-"Be the reason someone smiles. Be the reason someone feels loved and believes in the goodness in people. - Roy T. Bennett",
-"Accept yourself, love yourself, and keep moving forward. If you want to fly, you have to give up what weighs you down. - Roy T. Bennett",
-"Believe in yourself. You are braver than you think, more talented than you know, and capable of more than you imagine. - Roy T. Bennett",
-"Live the Life of Your Dreams: Be brave enough to live the life of your dreams according to your vision and purpose instead of the expectations and opinions of others. - Roy T. Bennett",
-"The past is a place of reference, not a place of residence; the past is a place of learning, not a place of living. - Roy T. Bennett",
-"Make improvements, not excuses. Seek respect, not attention. - Roy T. Bennett",
-"Life is about accepting the challenges along the way, choosing to keep moving forward, and savoring the journey. - Roy T. Bennett",
-"Time doesn’t heal emotional pain, you need to learn how to let go. - Roy T. Bennett",
-"Nothing can disturb your peace of mind unless you allow it to. - Roy T. Bennett",
-"You will never follow your own inner voice until you clear up the doubts in your mind. - Roy T. Bennett",
-"Being grateful does not mean that everything is necessarily good. It just means that you can accept it as a gift. - Roy T. Bennett",
-"Always find opportunities to make someone smile, and to offer random acts of kindness in everyday life. - Roy T. Bennett",
-"Courage is feeling fear, not getting rid of fear, and taking action in the face of fear. - Roy T. Bennett",
-"Failure is a bend in the road, not the end of the road. Learn from failure and keep moving forward. - Roy T. Bennett",
-"To learn something new, you need to try new things and not be afraid to be wrong. - Roy T. Bennett",
-"Sometimes all a person wants is an empathetic ear; all he or she needs is to talk it out. Just offering a listening ear and an understanding heart for his or her suffering can be a big comfort. - Roy T. Bennett",
-"It’s your life; you don’t need someone’s permission to live the life you want. Be brave to live from your heart. - Roy T. Bennett",
-"Be brave enough to live the life of your dreams according to your vision and purpose instead of the expectations and opinions of others. - Roy T. Bennett",
-"To have what you have never had, you have to do what you have never done. - Roy T. Bennett",
-"Never lose hope. Storms make people stronger and never last forever. - Roy T. Bennett",
-"The biggest wall you have to climb is the one you build in your mind: Never let your mind talk you out of your dreams, trick you into giving up. Never let your mind become the greatest obstacle to success. To get your mind on the right track, the rest will follow. - Roy T. Bennett",
-"Consistency is the true foundation of trust. Either keep your promises or do not make them. - Roy T. Bennett",
-"Stop doing what is easy. Start doing what is right. - Roy T. Bennett",
-"Maturity is when you stop complaining and making excuses, and start making changes. - Roy T. Bennett",
-"Do not fear failure but rather fear not trying. - Roy T. Bennett",
-"Stop doing what is easy or popular. Start doing what is right. - Roy T. Bennett",
-"Changing your outside world cannot make you happy if you are an unhappy person. The real personal change can only happen from the inside out. If you firstly create the change within yourself, you can turn your life around. - Roy T. Bennett",
-"Unless you try to do something beyond what you have already mastered, you will never grow. - Roy T. Bennett",
-"The one who falls and gets up is stronger than the one who never tried. Do not fear failure but rather fear not trying. - Roy T. Bennett",
-"Gratitude builds a bridge to abundance. - Roy T. Bennett",
-"Once you realize you deserve a bright future, letting go of your dark past is the best choice you will ever make. - Roy T. Bennett",
-"Always believe in yourself and always stretch yourself beyond your limits. Your life is worth a lot more than you think because you are capable of accomplishing more than you know. You have more potential than you think, but you will never know your full potential unless you keep challenging yourself and pushing beyond your own self imposed limits. - Roy T. Bennett",
-"Comfort zone: Simply means the routine of one’s daily life – it is a psychological state in which one feels familiar, safe, at ease, and secure. - Roy T. Bennett",
-"Believe in your infinite potential. Your only limitations are those you set upon yourself. - Roy T. Bennett",
-"Most of us must learn to love people and use things rather than loving things and using people. - Roy T. Bennett",
-"Surround yourself with people who believe in your dreams",
-    ]
-    await update.message.reply_text(f"💡 *“{random.choice(quotes)}”*", parse_mode='Markdown')
-
-
-async def team(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    team_text = (
-        "**👥 The OpenStart Team**\n\n"
-        "Our team is a global collaboration of passionate young leaders:\n"
-        "▪️ **Vikusyaaa** (Ukraine)\n"
-        "▪️ **Rakesh Kumar** (India)\n"
-        "▪️ **Cheedhe** (Tunisia)"
-    )
-    await update.message.reply_text(team_text, parse_mode='Markdown')
+    store = get_quote_store()
+    if context.args:
+        query = " ".join(context.args)
+        quote_id = store.search(query)
+        if quote_id is None:
+            await send_rendered(update.message.reply_text, f"Sorry, I couldn't find a quote matching '{query}'.", parse_mode=None)
+            return
+    else:
+        quote_id = store.next_for_user(update.effective_user.id)
+    await send_rendered(update.message.reply_text, QUOTE_TEMPLATE.render(quote=store.quotes[quote_id]))
+
+
+async def search(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if not context.args:
+        await update.message.reply_text("🔎 Usage: /search <words>, e.g. /search fee or /search failure")
+        return
+    query = " ".join(context.args)
+    index = get_search_index()
+    hits = index.search(query, SEARCH_MAX_RESULTS)
+    if not hits:
+        await send_rendered(update.message.reply_text, f"Sorry, nothing matched '{query}'.", parse_mode=None)
+        return
+    lines = [f"🔎 Results for '{query}':", ""]
+    for doc_id in hits:
+        title, snippet = index.display[doc_id]
+        lines.append(f"▪️ {title}: {snippet}" if title else f"▪️ {snippet}")
+    await send_rendered(update.message.reply_text, "\n".join(lines), parse_mode=None, disable_web_page_preview=True)
+
+# --- Command Registry ---
 
+# Every command, in /help order: name -> (description, handler or StaticReply).
+# Handlers, the /help text and the set_my_commands payload are all generated from this table.
+COMMANDS = {
+    "start": ("🚀 Start the bot", start),
+    "news": ("📰 Get news on a topic", news),
+    "about": ("🌍 Learn about OpenStart", ABOUT_REPLY),
+    "quote": ("💡 Get a motivational quote", quote),
+    "digest": ("🗞 Daily news digest (on/off)", digest),
+    "search": ("🔎 Search FAQ, resources and quotes", search),
+    "help": ("❓ See this list of commands", help_command),
+    "team": ("👥 Meet the OpenStart team", TEAM_REPLY),
+    "events": ("📅 See upcoming events", EVENTS_REPLY),
+    "mentor": ("🎓 Learn about mentorship", MENTOR_REPLY),
+    "resources": ("📚 Access learning materials", RESOURCES_REPLY),
+    "faq": ("❔ Frequently Asked Questions", FAQ_REPLY),
+    "apply": ("📝 Apply for our programs", form_handler("apply")),
+    "contact": ("📩 Get in touch with the team", CONTACT_REPLY),
+    "feedback": ("💬 Share your feedback with us", form_handler("feedback")),
+    "community": ("🌐 Join our global community", COMMUNITY_REPLY),
+}
+
+COMMAND_HANDLERS = {
+    command: handler if callable(handler) else static_handler(command, handler)
+    for command, (description, handler) in COMMANDS.items()
+}
 
-async def events(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text("📅 Upcoming events and deadlines will be announced here soon. Stay tuned!")
+HELP_REPLY = StaticReply(
+    "Here's the full list of what I can do for you:\n\n"
+    + "".join(f"/{command} - {description}\n" for command, (description, handler) in COMMANDS.items())
+)
 
+BOT_COMMANDS = tuple(BotCommand(command, description) for command, (description, handler) in COMMANDS.items())
 
-async def resources(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text("📚 We are compiling a library of guides, books, and tools for young founders. This feature will be available shortly!")
+# --- Search Index ---
 
+# In-memory inverted index with BM25 ranking. Documents are grouped by source, so one
+# source (e.g. the quote file) can be swapped out without rebuilding the others. The last
+# query word also matches as a prefix, so partial words ("entrepre") still find results.
+class SearchIndex:
+    K1 = 1.2
+    B = 0.75
 
-async def community(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    community_text = "🌐 Join our global community of young innovators on Discord to connect, collaborate, and share ideas!"
-    keyboard = [[InlineKeyboardButton("Join Discord", url="https://discord.gg/your-invite-link")]]  # Replace with real link
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await update.message.reply_text(community_text, reply_markup=reply_markup)
+    def __init__(self):
+        self.postings = {}  # term -> {doc_id: term frequency}
+        self.lengths = {}  # doc_id -> number of terms
+        self.sources = {}  # source -> list of doc_ids
+        self.display = {}  # doc_id -> (title, snippet)
+        self.total_length = 0
+        self._terms = None  # sorted vocabulary for prefix lookups, rebuilt on demand
 
+    def add(self, source, doc_id, text, title="", snippet=None):
+        tokens = tokenize(text)
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for term, count in counts.items():
+            self.postings.setdefault(sys.intern(term), {})[doc_id] = count
+        self.lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+        self.sources.setdefault(source, []).append(doc_id)
+        self.display[doc_id] = (title, snippet if snippet is not None else text)
+        self._terms = None
 
-async def mentor(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mentor_text = "🎓 We will initially assign a mentor for you related to your startup niche and business tech."
-    await update.message.reply_text(mentor_text)
+    def remove_source(self, source):
+        for doc_id in self.sources.pop(source, ()):
+            self.total_length -= self.lengths.pop(doc_id)
+            del self.display[doc_id]
+        doc_ids = set(self.display)
+        for term in list(self.postings):
+            docs = self.postings[term]
+            for doc_id in [doc_id for doc_id in docs if doc_id not in doc_ids]:
+                del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+        self._terms = None
 
+    def _expand(self, token):
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        start = bisect.bisect_left(self._terms, token)
+        end = bisect.bisect_left(self._terms, token + "\uffff")
+        return self._terms[start:end]
 
-async def faq(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    faq_text = (
-        "**❔ Frequently Asked Questions**\n\n"
-        "**Q: Who can apply for OpenStart?**\n"
-        "A: Ambitious high school students from anywhere in the world!\n\n"
-        "**Q: Is there a fee to participate?**\n"
-        "A: Our goal is to make our programs as accessible as possible. Details about costs will be available soon."
-    )
-    await update.message.reply_text(faq_text, parse_mode='Markdown')
+    def search(self, query, limit):
+        tokens = tokenize(query)
+        if not tokens or not self.lengths:
+            return []
+        doc_count = len(self.lengths)
+        average_length = self.total_length / doc_count or 1
+        scores = {}
+        for position, token in enumerate(tokens):
+            terms = self._expand(token) if position == len(tokens) - 1 else [token]
+            for term in terms:
+                docs = self.postings.get(term)
+                if not docs:
+                    continue
+                # Exact matches outrank prefix matches
+                weight = 1.0 if term == token else 0.5
+                idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                for doc_id, frequency in docs.items():
+                    norm = self.K1 * (1 - self.B + self.B * self.lengths[doc_id] / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf * frequency * (self.K1 + 1) / (frequency + norm)
+        return heapq.nlargest(limit, scores, key=scores.get)
 
 
-async def apply(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    apply_text = (
-        "📝 As of now, you can either visit our website or fill out this Google Form. "
-        "We will respond to you within 48 hours."
-    )
-    keyboard = [[InlineKeyboardButton("Fill Application Form", url="https://forms.gle/oqeBL4fRJXTnTymh9")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await update.message.reply_text(apply_text, reply_markup=reply_markup)
+def index_commands(index):
+    index.remove_source("commands")
+    for command, (description, handler) in COMMANDS.items():
+        text = description
+        if isinstance(handler, StaticReply):
+            body = handler.text
+            if handler.parse_mode == 'HTML':
+                body = html.unescape(re.sub(r"<[^>]+>", "", body))
+            text += "\n" + body
+        index.add("commands", f"cmd:{command}", text, title=f"/{command}", snippet=" ".join(text.split())[:160])
+
 
+def index_quotes(index, store):
+    index.remove_source("quotes")
+    for quote_id, line in enumerate(store.quotes):
+        index.add("quotes", f"quote:{quote_id}", line, snippet=f"💡 {line}")
 
-async def contact(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    contact_text = "📩 You can visit our website to get in touch with the OpenStart team."
-    await update.message.reply_text(contact_text)
 
+_search_index = None
 
-async def feedback(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    feedback_text = "💬 You can share your feedback with us by filling out this form."
-    keyboard = [[InlineKeyboardButton("Share Feedback", url="https://forms.gle/5azM3K8h7ek2B2cn8")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await update.message.reply_text(feedback_text, reply_markup=reply_markup)
+
+def get_search_index():
+    # Built on the first /search rather than at startup
+    global _search_index
+    if _search_index is None:
+        index = SearchIndex()
+        index_commands(index)
+        index_quotes(index, get_quote_store())
+        _search_index = index
+    return _search_index
+
+
+async def watch_content_files(context: ContextTypes.DEFAULT_TYPE):
+    # Reload the quote corpus and re-index just its documents when the file changes
+    global _quote_store, _quotes_mtime
+    if _quote_store is None:
+        return  # not loaded yet; the first use reads the current file anyway
+    mtime = os.path.getmtime(QUOTES_FILE)
+    if mtime == _quotes_mtime:
+        return
+    store = await asyncio.to_thread(QuoteStore.from_file, QUOTES_FILE)
+    _quote_store = store
+    _quotes_mtime = mtime
+    if _search_index is not None:
+        index_quotes(_search_index, store)
+    logging.info("Reloaded %d quotes from %s", len(store), QUOTES_FILE)
 
 # --- Message Handling ---
 
+async def greet(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(f"Hello {update.effective_user.first_name}! Use /help to see what I can do.")
+
+
+# Intent -> trigger phrases, in priority order. Phrases match whole words, case-insensitively;
+# whatever follows the phrase is passed to the handler as its arguments
+# ("news about AI" -> news with args ["AI"]).
+DEFAULT_INTENTS = {
+    "news": ["news about", "news on", "news for", "latest news", "any news"],
+    "apply": ["how do i apply", "how can i apply", "how to apply", "application form"],
+    "feedback": ["give feedback", "leave feedback", "share feedback", "some feedback"],
+    "faq": ["is there a fee", "who can apply", "how much does it cost"],
+    "quote": ["motivate me", "inspire me", "motivational quote", "give me a quote"],
+    "events": ["upcoming events", "any events", "next event"],
+    "mentor": ["find a mentor", "get a mentor", "mentorship"],
+    "contact": ["contact you", "get in touch", "contact the team"],
+    "help": ["what can you do", "list of commands"],
+    "greeting": ["hello", "hi", "hey", "good morning", "good evening"],
+}
+INTENT_HANDLERS = {"greeting": greet, **COMMAND_HANDLERS}
+
+
+# Phrases are stored in a word-level trie, so a message is tokenized once and scanned in a
+# single pass no matter how many intents there are. Matching on whole words means "this"
+# never triggers "hi". The highest-priority intent wins, then the leftmost, then the longest.
+INTENT_WORD_RE = re.compile(r"\w+")
+INTENT_ARG_FILLERS = frozenset(["about", "on", "for", "regarding", "of"])
+
+
+class IntentMatcher:
+    def __init__(self, intents):
+        self.trie = {}
+        for priority, (intent, phrases) in enumerate(intents.items()):
+            if intent not in INTENT_HANDLERS:
+                raise ValueError(f"Unknown intent '{intent}'")
+            for phrase in phrases:
+                node = self.trie
+                for word in INTENT_WORD_RE.findall(phrase.lower()):
+                    node = node.setdefault(word, {})
+                node.setdefault(None, (priority, intent))
+
+    def match(self, text):
+        words = INTENT_WORD_RE.findall(text.lower())
+        trie = self.trie
+        best = None  # (priority, start, -end, intent)
+        for start, word in enumerate(words):
+            node = trie.get(word)
+            end = start + 1
+            while node is not None:
+                hit = node.get(None)
+                if hit is not None:
+                    candidate = (hit[0], start, -end, hit[1])
+                    if best is None or candidate < best:
+                        best = candidate
+                if end == len(words):
+                    break
+                node = node.get(words[end])
+                end += 1
+        if best is None:
+            return None, []
+
+        args = words[-best[2]:]
+        while args and args[0] in INTENT_ARG_FILLERS:
+            args = args[1:]
+        return best[3], args
+
+
+def load_intents():
+    if not INTENTS_FILE:
+        return DEFAULT_INTENTS
+    with open(INTENTS_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+INTENT_MATCHER = IntentMatcher(load_intents())
+
+
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    text = update.message.text.lower()
-    if any(greeting in text for greeting in ["hello", "hi", "hey"]):
-        await update.message.reply_text(f"Hello {update.effective_user.first_name}! Use /help to see what I can do.")
-        raise ApplicationHandlerStop
+    intent, args = INTENT_MATCHER.match(update.message.text)
+    if intent is None:
+        return
+    context.args = args
+    await INTENT_HANDLERS[intent](update, context)
+    raise ApplicationHandlerStop
 
 async def unknown(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await context.bot.send_message(chat_id=update.effective_chat.id, text="Sorry, I didn't understand that. Try /help for a list of commands.")
 
+# --- Inline Mode ---
+
+# Keeps at most one pending lookup per user. Every keystroke sends a new inline query, so
+# a newer query cancels the older one's lookup instead of each fetching its own news.
+class InlineDebouncer:
+    def __init__(self, delay):
+        self.delay = delay
+        self._pending = {}  # user_id -> asyncio.Task
+        self.superseded = 0
+
+    async def run(self, user_id, lookup):
+        # Returns the lookup's result, or None if a newer query from the user superseded it
+        previous = self._pending.get(user_id)
+        if previous is not None and previous.cancel():
+            self.superseded += 1
+        task = asyncio.create_task(self._delayed(lookup))
+        self._pending[user_id] = task
+        try:
+            await asyncio.wait([task])
+        finally:
+            if self._pending.get(user_id) is task:
+                del self._pending[user_id]
+            task.cancel()
+        return None if task.cancelled() else task.result()
+
+    async def _delayed(self, lookup):
+        await asyncio.sleep(self.delay)
+        return await lookup()
+
+
+INLINE_DEBOUNCER = InlineDebouncer(INLINE_DEBOUNCE)
+
+
+def inline_quote_results(store, quote_ids):
+    results = []
+    for quote_id in quote_ids[:INLINE_MAX_RESULTS]:
+        line = store.quotes[quote_id]
+        results.append(InlineQueryResultArticle(
+            id=f"q{quote_id}",
+            title=line.rpartition(" - ")[0] or line,
+            description=store.authors[quote_id],
+            input_message_content=InputTextMessageContent(f"💡 “{line}”"),
+        ))
+    return results
+
+
+def inline_news_results(articles):
+    results = []
+    for article in articles[:INLINE_MAX_RESULTS]:
+        results.append(InlineQueryResultArticle(
+            id=hashlib.blake2b(article["url"].encode(), digest_size=16).hexdigest(),
+            title=article["title"],
+            description=(article.get("source") or {}).get("name"),
+            url=article["url"],
+            input_message_content=InputTextMessageContent(f"📰 {article['title']}\n{article['url']}"),
+        ))
+    return results
+
+
+async def inline_query(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.inline_query
+    text = " ".join(query.query.split())
+    command, _, rest = text.partition(" ")
+
+    # Quotes never touch the network, so they are answered straight away
+    if not text or command.lower() == "quote":
+        store = get_quote_store()
+        try:
+            if rest:
+                await query.answer(inline_quote_results(store, store.matches(rest)), cache_time=INLINE_QUOTE_CACHE_TIME)
+            else:
+                # A fresh sample each time; the user's /quote shuffle bag is left alone
+                quote_ids = random.sample(range(len(store.quotes)), min(INLINE_MAX_RESULTS, len(store.quotes)))
+                await query.answer(inline_quote_results(store, quote_ids), cache_time=0, is_personal=True)
+        except BadRequest as e:
+            logging.debug("Inline answer dropped: %s", e)
+        return
+
+    topic = normalize_topic(text)
+    articles = NEWS_CACHE.peek(topic)
+    if articles is None:
+        async def lookup():
+            if await USER_LIMITER.acquire(query.from_user.id):
+                return []
+            return await asyncio.wait_for(get_news(context.bot_data, topic), INLINE_FETCH_TIMEOUT)
+
+        try:
+            articles = await INLINE_DEBOUNCER.run(query.from_user.id, lookup)
+        except (CircuitOpenError, asyncio.TimeoutError):
+            await query.answer([], cache_time=0)
+            return
+        except Exception as e:
+            logging.error("Inline news error: %s", e)
+            await query.answer([], cache_time=0)
+            return
+        if articles is None:
+            return  # superseded by a newer query
+
+    if articles:
+        TOPIC_POPULARITY.record(topic)
+    # Let Telegram serve repeats of this query until our own copy goes stale
+    cache_time = max(0, int(NEWS_CACHE.expires_in(topic)))
+    try:
+        await query.answer(inline_news_results(articles), cache_time=cache_time)
+    except BadRequest as e:
+        # The user kept typing and Telegram already expired this query
+        logging.debug("Inline answer dropped: %s", e)
+
+# --- Update Processing ---
+
+def update_lane_key(update):
+    if isinstance(update, Update):
+        if update.inline_query:
+            # Inline queries from one user supersede each other instead of queueing up
+            return None
+        if update.effective_chat:
+            return update.effective_chat.id
+        if update.effective_user:
+            return update.effective_user.id
+    return None
+
+
+def update_age(update):
+    # Seconds since the message was sent; callbacks and inline queries carry no send time
+    message = update.message if isinstance(update, Update) else None
+    if message is None or message.date is None:
+        return 0.0
+    return time.time() - message.date.timestamp()
+
+
+def coalesce_key(update):
+    # Commands that are identical (including arguments) get a single reply per chat, or per
+    # sender in groups, where replies like /start's greeting are meant for one user
+    message = update.message if isinstance(update, Update) else None
+    if message is None or not message.text or not message.text.startswith("/"):
+        return None
+    command = " ".join(message.text.split())
+    if message.chat.type != "private" and message.from_user is not None:
+        return message.from_user.id, command
+    return command
+
+
+# Like asyncio.Semaphore, but waiters with a lower priority number are let in first
+# (in arrival order within a priority).
+class PrioritySemaphore:
+    def __init__(self, value):
+        self._value = value
+        self._waiters = []  # heap of (priority, seq, future)
+        self._seq = itertools.count()
+
+    async def acquire(self, priority):
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                self.release()  # the slot was handed over just as we were cancelled
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+
+# Runs updates from different chats concurrently (at most `max_concurrent_updates` at a
+# time) while updates from the same chat wait on that chat's lane lock, so they are
+# handled strictly in arrival order. The base class semaphore caps how many updates may
+# be pending (waiting on a lane or a worker slot) at once.
+#
+# When a backlog builds up, messages older than UPDATE_MAX_AGE are dropped, stale ones
+# wait for worker slots behind fresh ones, and a command that is already queued or
+# running in the same chat is coalesced into that one instead of answered again.
+class ChatLaneUpdateProcessor(BaseUpdateProcessor):
+    def __init__(self, max_concurrent_updates, max_pending_updates):
+        super().__init__(max(max_pending_updates, max_concurrent_updates, 2))
+        self._workers = PrioritySemaphore(max_concurrent_updates)
+        self._lanes = {}  # lane key -> [asyncio.Lock, number of updates using the lane, queued commands]
+        self.active = 0  # updates handed to us and not finished yet
+        self.running = 0  # of those, the ones holding a worker slot
+        self.dropped_stale = 0
+        self.coalesced = 0
+
+    @property
+    def waiting(self):
+        # Held back by max_pending_updates, a busy chat lane or the worker limit
+        return self.active - self.running
+
+    async def process_update(self, update, coroutine):
+        # Wraps (not replaces) PTB's version, so updates still waiting for one of its
+        # max_pending_updates slots are counted as well
+        self.active += 1
+        try:
+            await super().process_update(update, coroutine)
+        finally:
+            self.active -= 1
+
+    async def do_process_update(self, update, coroutine):
+        if isinstance(update, Update):
+            CORRELATION_ID.set(update.update_id)
+        age = update_age(update)
+        if UPDATE_MAX_AGE and age > UPDATE_MAX_AGE:
+            self.dropped_stale += 1
+            coroutine.close()
+            return
+        priority = int(age > UPDATE_STALE_AGE)
+
+        key = update_lane_key(update)
+        if key is None:
+            await self._run(coroutine, priority)
+            return
+
+        command = coalesce_key(update)
+        lane = self._lanes.get(key)
+        if lane is not None and command is not None and command in lane[2]:
+            self.coalesced += 1
+            coroutine.close()
+            return
+        if lane is None:
+            lane = self._lanes[key] = [asyncio.Lock(), 0, set()]
+        if command is not None:
+            lane[2].add(command)
+        lane[1] += 1
+        try:
+            async with lane[0]:
+                await self._run(coroutine, priority)
+        finally:
+            lane[1] -= 1
+            lane[2].discard(command)
+            if not lane[1]:
+                del self._lanes[key]
+
+    async def _run(self, coroutine, priority):
+        await self._workers.acquire(priority)
+        self.running += 1
+        try:
+            await coroutine
+        finally:
+            self.running -= 1
+            self._workers.release()
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+# --- Send Scheduler ---
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self):
+        # Takes one token (possibly going into debt) and returns how long to wait before using it
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+# Every Bot API request goes through this scheduler: it first waits on the target chat's
+# bucket, then queues for the global bucket in priority order. A RetryAfter from Telegram
+# pauses all sending for the requested time before the request is retried. With a shared
+# backend, the global limit also holds across workers: each send claims a slot in the
+# current one-second window there. Per-chat buckets stay per process.
+class SendScheduler(BaseRateLimiter):
+    def __init__(self, backend):
+        self.backend = backend
+        self._global = TokenBucket(SEND_GLOBAL_RATE, SEND_GLOBAL_RATE)
+        self._chats = OrderedDict()  # chat_id -> TokenBucket
+        self._queue = []  # heap of (priority, seq, future)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._paused_until = 0.0
+        self._dispatcher = None
+        self.waiting_on_chat = 0
+        self.sent = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+        self.retry_after_hits = 0
+
+    @property
+    def queue_depth(self):
+        return len(self._queue) + self.waiting_on_chat
+
+    async def initialize(self):
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def shutdown(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+
+    def _chat_bucket(self, chat_id):
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            is_group = isinstance(chat_id, str) or chat_id < 0
+            if is_group:
+                bucket = TokenBucket(SEND_GROUP_RATE_PER_MIN / 60, SEND_CHAT_BURST)
+            else:
+                bucket = TokenBucket(SEND_CHAT_RATE, SEND_CHAT_BURST)
+            self._chats[chat_id] = bucket
+            if len(self._chats) > SEND_MAX_CHAT_BUCKETS:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return bucket
+
+    async def _dispatch(self):
+        while True:
+            await self._wakeup.wait()
+            while self._queue:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                    continue
+                delay = self._global.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+                if self.backend.shared:
+                    await self._claim_shared_slot()
+                # Pop only after waiting so requests queued meanwhile can still jump ahead
+                _, _, future = heapq.heappop(self._queue)
+                if not future.done():
+                    future.set_result(None)
+            self._wakeup.clear()
+
+    async def _claim_shared_slot(self):
+        while True:
+            now = time.time()
+            window = int(now)
+            try:
+                count = await self.backend.incr(f"send:{window}", 2)
+            except Exception as e:
+                logging.warning("Shared send limit check failed: %r", e)
+                return
+            if count <= SEND_GLOBAL_RATE:
+                return
+            await asyncio.sleep(window + 1 - now)
+
+    async def _wait_for_turn(self, chat_id, priority):
+        if chat_id is not None:
+            self.waiting_on_chat += 1
+            try:
+                await asyncio.sleep(self._chat_bucket(chat_id).reserve())
+            finally:
+                self.waiting_on_chat -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._seq), future))
+        self._wakeup.set()
+        await future
+
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        chat_id = data.get("chat_id")
+        priority = rate_limit_args if isinstance(rate_limit_args, int) else PRIORITY_INTERACTIVE
+        for attempt in range(SEND_MAX_RETRIES + 1):
+            queued_at = time.monotonic()
+            await self._wait_for_turn(chat_id, priority)
+            delay = time.monotonic() - queued_at
+            self.total_delay += delay
+            self.max_delay = max(self.max_delay, delay)
+            try:
+                result = await callback(*args, **kwargs)
+                self.sent += 1
+                return result
+            except RetryAfter as exc:
+                self.retry_after_hits += 1
+                if attempt == SEND_MAX_RETRIES:
+                    raise
+                retry_after = exc.retry_after
+                if not isinstance(retry_after, (int, float)):
+                    retry_after = retry_after.total_seconds()
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after + 0.1)
+                logging.warning("Flood control on %s, pausing sends for %ss", endpoint, retry_after)
+                await asyncio.sleep(retry_after + 0.1)
+
+# --- User Store ---
+
+USER_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    first_name TEXT,
+    username TEXT,
+    language TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_last_seen ON users (last_seen);
+CREATE INDEX IF NOT EXISTS users_language ON users (language, last_seen);
+CREATE TABLE IF NOT EXISTS chats (
+    chat_id INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    title TEXT,
+    blocked INTEGER NOT NULL DEFAULT 0,
+    digest INTEGER NOT NULL DEFAULT 0,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chats_type_last_seen ON chats (type, blocked, last_seen);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    form TEXT NOT NULL,
+    user_id INTEGER NOT NULL,
+    chat_id INTEGER NOT NULL,
+    answers TEXT NOT NULL,
+    submitted REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS submissions_form ON submissions (form, id);
+"""
+
+UPSERT_USER = """
+INSERT INTO users (user_id, first_name, username, language, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (user_id) DO UPDATE SET
+    first_name = excluded.first_name,
+    username = excluded.username,
+    language = COALESCE(excluded.language, users.language),
+    last_seen = MAX(users.last_seen, excluded.last_seen)
+"""
+
+UPSERT_CHAT = """
+INSERT INTO chats (chat_id, type, title, blocked, first_seen, last_seen)
+VALUES (?, ?, ?, 0, ?, ?)
+ON CONFLICT (chat_id) DO UPDATE SET
+    type = excluded.type,
+    title = excluded.title,
+    blocked = 0,
+    last_seen = MAX(chats.last_seen, excluded.last_seen)
+"""
+
+INSERT_SUBMISSION = """
+INSERT INTO submissions (form, user_id, chat_id, answers, submitted)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+
+# Users and chats seen by the bot, stored in SQLite (WAL mode). record() only updates an
+# in-memory write-behind buffer (repeat sightings of a user coalesce into one row), which
+# a background task flushes in batches; every database call runs on one dedicated thread.
+# Form submissions ride the same buffer and are only ever appended.
+class UserStore:
+    def __init__(self, path):
+        self.path = path
+        self._db = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="user-store")
+        self._pending_users = {}
+        self._pending_chats = {}
+        self._pending_submissions = []
+        self._flush_requested = asyncio.Event()
+        self._flusher = None
+        self.flushes = 0
+        self.rows_written = 0
+
+    @property
+    def pending_writes(self):
+        return len(self._pending_users) + len(self._pending_chats) + len(self._pending_submissions)
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(USER_STORE_SCHEMA)
+        columns = {row[1] for row in db.execute("PRAGMA table_info(chats)")}
+        if "digest" not in columns:
+            db.execute("ALTER TABLE chats ADD COLUMN digest INTEGER NOT NULL DEFAULT 0")
+        return db
+
+    async def open(self):
+        if self._db is None:
+            self._db = await self._run(self._connect)
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def close(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        if self._db is not None:
+            await self.flush()
+            await self._run(self._db.close)
+            self._db = None
+
+    def record(self, user, chat):
+        now = time.time()
+        if user is not None and not user.is_bot:
+            self._pending_users[user.id] = (user.id, user.first_name, user.username, user.language_code, now, now)
+        if chat is not None:
+            self._pending_chats[chat.id] = (chat.id, chat.type, chat.title, now, now)
+        if self.pending_writes >= USER_STORE_BATCH_SIZE:
+            self._flush_requested.set()
+
+    def add_submission(self, form, user_id, chat_id, answers):
+        self._pending_submissions.append((form, user_id, chat_id, json.dumps(answers, ensure_ascii=False), time.time()))
+        if self.pending_writes >= USER_STORE_BATCH_SIZE:
+            self._flush_requested.set()
+
+    def _write(self, users, chats, submissions):
+        with self._db:
+            self._db.executemany(UPSERT_USER, users)
+            self._db.executemany(UPSERT_CHAT, chats)
+            self._db.executemany(INSERT_SUBMISSION, submissions)
+
+    async def flush(self):
+        if not self.pending_writes or self._db is None:
+            return
+        users, self._pending_users = list(self._pending_users.values()), {}
+        chats, self._pending_chats = list(self._pending_chats.values()), {}
+        submissions, self._pending_submissions = self._pending_submissions, []
+        try:
+            await self._run(self._write, users, chats, submissions)
+        except sqlite3.Error as e:
+            logging.error("User store flush failed: %s", e)
+            # Users and chats are seen again soon enough, but a lost submission is gone for good
+            self._pending_submissions[:0] = submissions
+            return
+        self.flushes += 1
+        self.rows_written += len(users) + len(chats) + len(submissions)
+
+    async def _flush_periodically(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), USER_STORE_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    def _query(self, sql, params):
+        return self._db.execute(sql, params).fetchall()
+
+    async def chat_ids(self, active_days=None, language=None, after=None):
+        # Reachable private chats, optionally segmented; uses the (type, blocked, last_seen)
+        # and (language, last_seen) indexes
+        sql = "SELECT c.chat_id FROM chats c"
+        where = ["c.type = 'private'", "c.blocked = 0"]
+        params = []
+        if language is not None:
+            sql += " JOIN users u ON u.user_id = c.chat_id"
+            where.append("u.language = ?")
+            params.append(language)
+        if active_days is not None:
+            where.append("c.last_seen >= ?")
+            params.append(time.time() - active_days * 86400)
+        if after is not None:
+            where.append("c.chat_id > ?")
+            params.append(after)
+        sql += " WHERE " + " AND ".join(where) + " ORDER BY c.chat_id"
+        return [row[0] for row in await self._run(self._query, sql, params)]
+
+    async def count_users(self, active_days=None):
+        sql = "SELECT COUNT(*) FROM users"
+        params = []
+        if active_days is not None:
+            sql += " WHERE last_seen >= ?"
+            params.append(time.time() - active_days * 86400)
+        return (await self._run(self._query, sql, params))[0][0]
+
+    async def digest_chat_ids(self):
+        sql = "SELECT chat_id FROM chats WHERE digest = 1 AND blocked = 0 ORDER BY chat_id"
+        return [row[0] for row in await self._run(self._query, sql, ())]
+
+    def _set_digest(self, chat_id, enabled):
+        with self._db:
+            self._db.execute("UPDATE chats SET digest = ? WHERE chat_id = ?", (int(enabled), chat_id))
+
+    async def set_digest(self, chat_id, enabled):
+        await self._run(self._set_digest, chat_id, enabled)
+
+    def _get_meta(self, key):
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    async def get_meta(self, key):
+        return await self._run(self._get_meta, key)
+
+    def _set_meta(self, key, value):
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    async def set_meta(self, key, value):
+        await self._run(self._set_meta, key, value)
+
+    def _set_blocked(self, chat_ids):
+        with self._db:
+            self._db.executemany("UPDATE chats SET blocked = 1 WHERE chat_id = ?", [(chat_id,) for chat_id in chat_ids])
+
+    async def mark_blocked(self, chat_ids):
+        if chat_ids:
+            await self._run(self._set_blocked, chat_ids)
+
+    def _export_submissions(self, form):
+        sql = "SELECT id, form, user_id, chat_id, answers, submitted FROM submissions"
+        params = ()
+        if form is not None:
+            sql += " WHERE form = ?"
+            params = (form,)
+        lines = []
+        for submission_id, form_name, user_id, chat_id, answers, submitted in self._db.execute(sql + " ORDER BY id", params):
+            lines.append(json.dumps({
+                "id": submission_id,
+                "form": form_name,
+                "user_id": user_id,
+                "chat_id": chat_id,
+                "submitted": datetime.datetime.fromtimestamp(submitted, datetime.timezone.utc).isoformat(),
+                "answers": json.loads(answers),
+            }, ensure_ascii=False))
+        return len(lines), "".join(line + "\n" for line in lines).encode("utf-8")
+
+    async def export_submissions(self, form=None):
+        # All submissions (optionally of one form) as JSON lines, oldest first
+        await self.flush()
+        return await self._run(self._export_submissions, form)
+
+
+USER_STORE = UserStore(USER_DB_FILE)
+
+# --- Prefetching & Digests ---
+
+def prefetch_share():
+    # Calls above the reserve, spread evenly over the runs left in this UTC day
+    runs_left = math.ceil((86400 - time.time() % 86400) / NEWS_PREFETCH_INTERVAL)
+    return max(0, NEWS_QUOTA.remaining - NEWS_QUOTA.reserve) / max(1, runs_left)
+
+
+async def prefetch_popular_topics(context: ContextTypes.DEFAULT_TYPE):
+    if NEWS_QUOTA.low:
+        # Keep what's left of today's quota for users' own requests
+        return
+    # Each run earns its share of the budget (unspent shares carry over, up to one full
+    # run's worth) and spends it on the most popular topics first, roughly one call per
+    # refresh, so the prefetcher can't drain the quota in the first hour of the day
+    allowance = min(context.bot_data.get("prefetch_allowance", 0.0) + prefetch_share(), NEWS_PREFETCH_TOP_N)
+    for topic in TOPIC_POPULARITY.top(NEWS_PREFETCH_TOP_N):
+        if allowance < 1:
+            break
+        # Only refresh topics that would go stale before the next run
+        if NEWS_CACHE.expires_in(topic) > NEWS_PREFETCH_INTERVAL:
+            continue
+        allowance -= 1
+        try:
+            await NEWS_CACHE.refresh(topic, lambda topic=topic: aggregate_news(context.bot_data, topic))
+        except Exception as e:
+            logging.warning("Prefetch of '%s' failed: %s", topic, e)
+    context.bot_data["prefetch_allowance"] = allowance
+
+
+async def send_daily_digest(context: ContextTypes.DEFAULT_TYPE):
+    # Built only from what the prefetcher already keeps warm; no upstream calls here
+    sections = []
+    for topic in TOPIC_POPULARITY.top(DIGEST_TOPICS) or ["startup"]:
+        articles = NEWS_CACHE.peek(topic)
+        if articles:
+            sections.append(format_news(topic, articles[:3]))
+    if not sections:
+        logging.info("Skipping daily digest: no cached news")
+        return
+
+    # With several workers, only the first to get here sends today's digest. If the backend
+    # can't tell, send anyway: a rare duplicate beats nobody getting today's digest.
+    try:
+        claimed = await STATE.incr(f"digest:{time.strftime('%Y-%m-%d', time.gmtime())}", 86400)
+    except Exception as e:
+        logging.warning("Digest claim failed, sending anyway: %r", e)
+        claimed = 1
+    if claimed > 1:
+        return
+
+    text = DIGEST_HEADING + "".join(sections)
+    chat_ids = await USER_STORE.digest_chat_ids()
+    for offset in range(0, len(chat_ids), BROADCAST_BATCH_SIZE):
+        batch = chat_ids[offset:offset + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(
+                send_rendered(functools.partial(context.bot.send_message, chat_id), text, disable_web_page_preview=True, rate_limit_args=PRIORITY_BULK)
+                for chat_id in batch
+            ),
+            return_exceptions=True,
+        )
+        await USER_STORE.mark_blocked([chat_id for chat_id, result in zip(batch, results) if isinstance(result, Forbidden)])
+
+
+def schedule_jobs(application: Application):
+    if application.job_queue is None:
+        logging.warning("JobQueue unavailable (install python-telegram-bot[job-queue]); prefetching, digests and content reloading are disabled")
+        return
+    application.job_queue.run_repeating(watch_content_files, interval=CONTENT_WATCH_INTERVAL, first=CONTENT_WATCH_INTERVAL)
+    application.job_queue.run_repeating(prefetch_popular_topics, interval=NEWS_PREFETCH_INTERVAL, first=NEWS_PREFETCH_INTERVAL)
+    hour, minute = map(int, DIGEST_TIME.split(":"))
+    application.job_queue.run_daily(send_daily_digest, time=datetime.time(hour, minute, tzinfo=datetime.timezone.utc))
+
+# --- Broadcasts ---
+
+async def track_chat(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if "first_update" not in STARTUP_TIMINGS:
+        STARTUP_TIMINGS["first_update"] = time.perf_counter() - STARTUP_STARTED
+    USER_STORE.record(update.effective_user, update.effective_chat)
+
+
+def admin_only(callback):
+    @functools.wraps(callback)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if update.effective_user is None or update.effective_user.id not in ADMIN_IDS:
+            await unknown(update, context)
+            return
+        return await callback(update, context)
+
+    return wrapper
+
+
+def save_broadcast_state(state):
+    tmp_path = BROADCAST_STATE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, BROADCAST_STATE_FILE)
+
+
+def remove_broadcast_state():
+    if os.path.exists(BROADCAST_STATE_FILE):
+        os.remove(BROADCAST_STATE_FILE)
+
+
+def load_broadcast_state():
+    if not os.path.exists(BROADCAST_STATE_FILE):
+        return None
+    with open(BROADCAST_STATE_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def format_broadcast_progress(state):
+    done = state["sent"] + state["failed"] + state["blocked"]
+    total = state.get("total", done)
+    rate = state.get("rate", 0)
+    remaining = max(0, total - done)
+    eta = f"{int(remaining / rate) // 60}m{int(remaining / rate) % 60:02d}s" if rate > 0 else "unknown"
+    return (
+        f"📣 Broadcast {state['status']}: {done}/{total} processed\n"
+        f"✅ sent {state['sent']} · 🚫 blocked {state['blocked']} · ⚠️ failed {state['failed']}\n"
+        f"⚡ {rate:.1f} msg/s · ETA {eta}"
+    )
+
+
+# Chats are processed in ascending id order and the last finished id is checkpointed
+# after every batch, so a restart resumes right after it (at most one batch is re-sent).
+async def run_broadcast(bot, state):
+    await USER_STORE.flush()
+    targets = await USER_STORE.chat_ids(state["active_days"], state["language"], after=state["cursor"])
+    state["total"] = state["sent"] + state["failed"] + state["blocked"] + len(targets)
+    started = time.monotonic()
+    processed_here = 0
+    last_report = 0.0
+
+    async def report():
+        try:
+            await bot.edit_message_text(
+                format_broadcast_progress(state),
+                chat_id=state["admin_chat_id"],
+                message_id=state["status_message_id"],
+            )
+        except BadRequest:
+            pass  # "message is not modified" or the status message is gone
+
+    for offset in range(0, len(targets), BROADCAST_BATCH_SIZE):
+        batch = targets[offset:offset + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(bot.send_message(chat_id, state["text"], rate_limit_args=PRIORITY_BULK) for chat_id in batch),
+            return_exceptions=True,
+        )
+        blocked = []
+        for chat_id, result in zip(batch, results):
+            if not isinstance(result, Exception):
+                state["sent"] += 1
+            elif isinstance(result, Forbidden) or (isinstance(result, BadRequest) and "chat not found" in result.message.lower()):
+                blocked.append(chat_id)
+            else:
+                state["failed"] += 1
+                logging.warning("Broadcast to %s failed: %s", chat_id, result)
+        state["blocked"] += len(blocked)
+        await USER_STORE.mark_blocked(blocked)
+        state["cursor"] = batch[-1]
+        save_broadcast_state(state)
+        processed_here += len(batch)
+        state["rate"] = processed_here / max(time.monotonic() - started, 1e-6)
+
+        if time.monotonic() - last_report >= BROADCAST_REPORT_INTERVAL:
+            last_report = time.monotonic()
+            await report()
+
+    state["status"] = "finished"
+    remove_broadcast_state()
+    await report()
+
+
+def log_broadcast_failure(task):
+    if not task.cancelled() and task.exception() is not None:
+        logging.error("Broadcast failed: %s", task.exception())
+
+
+def start_broadcast_task(application, state):
+    task = asyncio.create_task(run_broadcast(application.bot, state))
+    task.add_done_callback(log_broadcast_failure)
+    application.bot_data["broadcast_task"] = task
+    application.bot_data["broadcast_state"] = state
+    return task
+
+
+def parse_broadcast_segment(text):
+    # Leading "days=N" / "lang=xx" options narrow the audience
+    segment = {"active_days": None, "language": None}
+    while True:
+        option, _, rest = text.partition(" ")
+        key, sep, value = option.partition("=")
+        if not sep or not rest.strip():
+            return segment, text
+        if key == "days" and value.isdigit():
+            segment["active_days"] = int(value)
+        elif key == "lang" and value:
+            segment["language"] = value.lower()
+        else:
+            return segment, text
+        text = rest.strip()
+
+
+@admin_only
+async def broadcast(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    task = context.bot_data.get("broadcast_task")
+    running = task is not None and not task.done()
+    parts = update.message.text.split(None, 1)
+    text = parts[1].strip() if len(parts) > 1 else ""
+
+    if text == "cancel":
+        if running:
+            task.cancel()
+            remove_broadcast_state()
+            await update.message.reply_text("🛑 Broadcast cancelled.")
+        else:
+            await update.message.reply_text("No broadcast is running.")
+        return
+    if not text or text == "status":
+        if running:
+            await update.message.reply_text(format_broadcast_progress(context.bot_data["broadcast_state"]))
+        else:
+            await USER_STORE.flush()
+            subscribers = len(await USER_STORE.chat_ids())
+            users = await USER_STORE.count_users()
+            active = await USER_STORE.count_users(active_days=7)
+            await update.message.reply_text(
+                f"No broadcast is running. {subscribers} subscribers; {users} users, {active} active in the last 7 days.\n"
+                "Usage: /broadcast [days=N] [lang=xx] <message> | status | cancel"
+            )
+        return
+    if running:
+        await update.message.reply_text("A broadcast is already running. Use /broadcast cancel to stop it.")
+        return
+
+    segment, text = parse_broadcast_segment(text)
+    await USER_STORE.flush()
+    audience = len(await USER_STORE.chat_ids(segment["active_days"], segment["language"]))
+    status_message = await update.message.reply_text(f"📣 Starting broadcast to {audience} subscribers...")
+    state = {
+        "text": text,
+        **segment,
+        "cursor": None,
+        "sent": 0,
+        "failed": 0,
+        "blocked": 0,
+        "status": "running",
+        "admin_chat_id": update.effective_chat.id,
+        "status_message_id": status_message.message_id,
+    }
+    save_broadcast_state(state)
+    start_broadcast_task(context.application, state)
+
+
+@admin_only
+async def export(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    form = context.args[0].lower() if context.args else None
+    if form is not None and form not in FORMS:
+        await update.message.reply_text(f"Usage: /export [{'|'.join(FORMS)}]")
+        return
+    count, data = await USER_STORE.export_submissions(form)
+    if not count:
+        await update.message.reply_text("No submissions yet.")
+        return
+    filename = f"{form or 'submissions'}-{datetime.datetime.now(datetime.timezone.utc):%Y%m%d-%H%M%S}.jsonl"
+    await update.message.reply_document(data, filename=filename, caption=f"📦 {count} submissions")
+
+
+ADMIN_COMMAND_HANDLERS = {
+    "broadcast": broadcast,
+    "export": export,
+}
+
 # --- Bot Setup ---
 
-async def post_init(application: Application):
-    bot_commands = [(command, description) for command, description in COMMANDS.items()]
-    await application.bot.set_my_commands(bot_commands)
+def build_http_client():
+    http2 = NEWS_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401  (installed via `pip install httpx[http2]`)
+        except ImportError:
+            logging.warning("NEWS_HTTP2 is enabled but the 'h2' package is missing; falling back to HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        base_url=NEWS_API_BASE_URL,
+        headers={"X-Api-Key": NEWS_API_KEY or ""},
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=NEWS_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=NEWS_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=NEWS_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(NEWS_HTTP_READ_TIMEOUT, connect=NEWS_HTTP_CONNECT_TIMEOUT),
+    )
+
+
+def commands_hash():
+    payload = json.dumps([[command.command, command.description] for command in BOT_COMMANDS], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+async def sync_bot_commands(bot):
+    # set_my_commands is a round-trip before the bot can take updates; skip it while the
+    # command menu Telegram already has matches COMMANDS
+    key = f"commands_hash:{bot.id}"
+    payload_hash = commands_hash()
+    if await USER_STORE.get_meta(key) == payload_hash:
+        return
+    await bot.set_my_commands(BOT_COMMANDS)
+    await USER_STORE.set_meta(key, payload_hash)
     print("Bot commands set successfully!")
 
+
+def report_startup():
+    STARTUP_TIMINGS["ready"] = time.perf_counter() - STARTUP_STARTED
+    logging.info("Startup timings: %s", ", ".join(f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in STARTUP_TIMINGS.items()))
+
+
+async def post_init(application: Application):
+    init_started = time.perf_counter()
+    application.bot_data["http_client"] = build_http_client()
+    # Feeds get their own client so the NewsAPI key header never goes to feed hosts
+    application.bot_data["feed_client"] = httpx.AsyncClient(
+        timeout=httpx.Timeout(NEWS_FEED_TIMEOUT),
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=NEWS_HTTP_MAX_CONNECTIONS),
+    )
+    await USER_STORE.open()
+    METRICS.application = application
+    application.bot_data["loop_lag_task"] = asyncio.create_task(monitor_loop_lag())
+
+    await sync_bot_commands(application.bot)
+    schedule_jobs(application)
+
+    state = load_broadcast_state()
+    if state is not None and state["status"] == "running":
+        print("Resuming interrupted broadcast...")
+        start_broadcast_task(application, state)
+
+    STARTUP_TIMINGS["init"] = time.perf_counter() - init_started
+    if BOT_MODE != "webhook":
+        # Polling starts right after post_init; in webhook mode run_webhook reports instead
+        report_startup()
+
+
+async def post_shutdown(application: Application):
+    broadcast_task = application.bot_data.pop("broadcast_task", None)
+    if broadcast_task is not None:
+        broadcast_task.cancel()
+    task = application.bot_data.pop("loop_lag_task", None)
+    if task is not None:
+        task.cancel()
+    for key in ("http_client", "feed_client"):
+        client = application.bot_data.pop(key, None)
+        if client is not None:
+            await client.aclose()
+    await USER_STORE.close()
+    await STATE.close()
+
+
+async def run_webhook(application: Application):
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse, Response
+    from starlette.routing import Route
+
+    async def telegram_webhook(request: Request):
+        secret = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+        # Compare bytes: compare_digest rejects str with non-ASCII characters
+        if not hmac.compare_digest(secret.encode(), WEBHOOK_SECRET.encode()):
+            return Response(status_code=403)
+        try:
+            data = await request.json()
+            if not isinstance(data, dict):
+                return Response(status_code=400)
+            update = Update.de_json(data, application.bot)
+        except (ValueError, TypeError, AttributeError, KeyError):
+            return Response(status_code=400)
+        # Acknowledge right away; the application processes the update from its queue
+        await application.update_queue.put(update)
+        return Response()
+
+    async def health(request: Request):
+        return PlainTextResponse("Bot is alive!")
+
+    async def metrics_endpoint(request: Request):
+        return Response(METRICS.render(), media_type=METRICS_CONTENT_TYPE)
+
+    web_app = Starlette(routes=[
+        Route("/", health),
+        Route("/metrics", metrics_endpoint),
+        Route(WEBHOOK_PATH, telegram_webhook, methods=["POST"]),
+    ])
+    # uvicorn would re-raise SIGTERM/SIGINT once it stops serving, killing the process
+    # before the application stops and post_shutdown flushes the user store
+    class WebhookServer(uvicorn.Server):
+        @contextlib.contextmanager
+        def capture_signals(self):
+            yield
+
+    # limit_concurrency makes uvicorn answer 503 beyond WEBHOOK_MAX_INFLIGHT requests,
+    # which Telegram retries later
+    server = WebhookServer(uvicorn.Config(
+        web_app,
+        host="0.0.0.0",
+        port=int(os.environ.get('PORT', 8080)),
+        limit_concurrency=WEBHOOK_MAX_INFLIGHT,
+        log_level="warning",
+        log_config=None,  # keep uvicorn's records on our queued handler
+    ))
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, setattr, server, "should_exit", True)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        async with application:
+            await post_init(application)
+            await application.bot.set_webhook(
+                url=WEBHOOK_URL.rstrip("/") + WEBHOOK_PATH,
+                secret_token=WEBHOOK_SECRET,
+                max_connections=WEBHOOK_MAX_CONNECTIONS,
+                allowed_updates=Update.ALL_TYPES,
+            )
+            await application.start()
+            print("Telegram bot webhook server started!")
+            report_startup()
+            try:
+                await server.serve()
+            finally:
+                await application.stop()
+    finally:
+        await post_shutdown(application)
+
+
+def build_application():
+    builder = (
+        Application.builder()
+        .token(TOKEN)
+        .base_url(TELEGRAM_API_URL)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .concurrent_updates(ChatLaneUpdateProcessor(CONCURRENT_UPDATES, MAX_PENDING_UPDATES))
+        .rate_limiter(SendScheduler(STATE))
+    )
+    if BOT_MODE == "webhook":
+        # Updates arrive through our own web server, so no Updater is needed
+        builder = builder.updater(None)
+    application = builder.build()
+
+    # Record every user and chat in the user store before anything else runs
+    application.add_handler(TypeHandler(Update, track_chat), group=-1)
+
+    # Register handlers
+    for command, handler in COMMAND_HANDLERS.items():
+        application.add_handler(CommandHandler(command, instrument(handler)))
+    for command, handler in FORM_COMMAND_HANDLERS.items():
+        application.add_handler(CommandHandler(command, instrument(handler)))
+    for command, handler in ADMIN_COMMAND_HANDLERS.items():
+        application.add_handler(CommandHandler(command, instrument(handler)))
+
+    application.add_handler(CallbackQueryHandler(instrument(news_page_callback), pattern=r"^news:"))
+    application.add_handler(InlineQueryHandler(instrument(inline_query)))
+
+    # While a form is open, the user's messages are its answers
+    application.add_handler(MessageHandler(filters.UpdateType.MESSAGE & filters.ChatType.PRIVATE & filters.TEXT & ~filters.COMMAND & FormSessionFilter(), instrument(form_answer)))
+
+    # Fallbacks
+    application.add_handler(MessageHandler(filters.UpdateType.MESSAGE & filters.TEXT & ~filters.COMMAND, instrument(handle_message)))
+    application.add_handler(MessageHandler(filters.COMMAND, instrument(unknown)))
+    return application
+
+
 def main():
     if not TOKEN:
         logging.error("TELEGRAM_TOKEN is not set!")
@@ -856,36 +3335,26 @@ def main():
     if not NEWS_API_KEY:
         logging.error("NEWS_API_KEY is not set!")
         return
-
-    # Start Flask server in background
-    flask_thread = threading.Thread(target=run_flask_app)
-    flask_thread.start()
+    if BOT_MODE == "webhook" and not (WEBHOOK_URL and WEBHOOK_SECRET):
+        logging.error("WEBHOOK_URL and WEBHOOK_SECRET must be set in webhook mode!")
+        return
 
     # Start Telegram bot
-    application = Application.builder().token(TOKEN).post_init(post_init).build()
+    application = build_application()
 
-    # Register handlers
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("about", about))
-    application.add_handler(CommandHandler("news", news))
-    application.add_handler(CommandHandler("quote", quote))
-    application.add_handler(CommandHandler("team", team))
-    application.add_handler(CommandHandler("events", events))
-    application.add_handler(CommandHandler("resources", resources))
-    application.add_handler(CommandHandler("community", community))
-    application.add_handler(CommandHandler("mentor", mentor))
-    application.add_handler(CommandHandler("faq", faq))
-    application.add_handler(CommandHandler("apply", apply))
-    application.add_handler(CommandHandler("contact", contact))
-    application.add_handler(CommandHandler("feedback", feedback))
+    if BOT_MODE == "webhook":
+        print("Starting Telegram bot in webhook mode...")
+        asyncio.run(run_webhook(application))
+        return
 
-    # Fallbacks
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
-    application.add_handler(MessageHandler(filters.COMMAND, unknown))
+    # Start Flask server in background
+    flask_thread = threading.Thread(target=run_flask_app)
+    flask_thread.start()
 
     print("Starting Telegram bot polling...")
     application.run_polling()
 
+STARTUP_TIMINGS["import"] = time.perf_counter() - STARTUP_STARTED
+
 if __name__ == "__main__":
     main()
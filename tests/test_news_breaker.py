@@ -0,0 +1,71 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import my_bot
+
+
+def make_client(hang):
+    async def handler(request):
+        if hang.is_set():
+            await asyncio.sleep(60)
+        return httpx.Response(200, json={"articles": [{"title": "Seed round", "url": "https://example.com/1"}]})
+
+    return httpx.AsyncClient(base_url="http://newsapi.test", transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = my_bot.CircuitBreaker(threshold=1, cooldown=0.05)
+    monkeypatch.setattr(my_bot, "NEWS_BREAKER", breaker)
+    monkeypatch.setattr(my_bot, "NEWS_FETCH_DEADLINE", 0.05)
+    monkeypatch.setattr(my_bot, "NEWS_FETCH_RETRIES", 0)
+    monkeypatch.setattr(my_bot, "NEWS_QUOTA", my_bot.QuotaAccountant(1000, 0, my_bot.MemoryBackend(100)))
+    return breaker
+
+
+async def open_breaker(client, hang):
+    hang.set()
+    with pytest.raises(asyncio.TimeoutError):
+        await my_bot.fetch_articles(client, "funding")
+    await asyncio.sleep(0.06)  # cooldown passes; the next call is the half-open probe
+
+
+def test_probe_times_out_then_next_call_after_cooldown_is_allowed(breaker):
+    async def scenario():
+        hang = asyncio.Event()
+        async with make_client(hang) as client:
+            await open_breaker(client, hang)
+            with pytest.raises(asyncio.TimeoutError):
+                await my_bot.fetch_articles(client, "funding")
+            assert breaker.is_open and not breaker.probing
+
+            await asyncio.sleep(0.06)
+            hang.clear()
+            articles = await my_bot.fetch_articles(client, "funding")
+            assert articles and breaker.failures == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_releases_half_open_slot(breaker):
+    async def scenario():
+        hang = asyncio.Event()
+        async with make_client(hang) as client:
+            await open_breaker(client, hang)
+            probe = asyncio.create_task(my_bot.fetch_articles(client, "funding"))
+            await asyncio.sleep(0.01)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            assert not breaker.probing
+
+            hang.clear()
+            assert await my_bot.fetch_articles(client, "funding")
+
+    asyncio.run(scenario())
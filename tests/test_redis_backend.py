@@ -0,0 +1,157 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import my_bot
+
+
+# Small RESP server covering the commands RedisBackend sends. Replies on a connection go
+# out in command order, like Redis; `delays` holds back the reply for a key and `drop`
+# closes the connection when that key is next used.
+class StandIn:
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.delays = {}
+        self.drop = set()
+        self.connections = 0
+        self.writers = []
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        for writer in self.writers:
+            writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def disconnect_all(self):
+        for writer in self.writers:
+            writer.close()
+
+    def lookup(self, key):
+        if key in self.expiry and self.expiry[key] < time.monotonic():
+            self.data.pop(key, None)
+            self.expiry.pop(key)
+        return self.data.get(key)
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        self.writers.append(writer)
+        try:
+            while True:
+                command, *args = await read_command(reader)
+                key = args[0] if args else None
+                if key in self.drop:
+                    self.drop.discard(key)
+                    break
+                if key in self.delays:
+                    await asyncio.sleep(self.delays.pop(key))
+                writer.write(self.reply(command.upper(), args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def reply(self, command, args):
+        if command == b"GET":
+            value = self.lookup(args[0])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            self.data[args[0]] = args[1]
+            self.expiry[args[0]] = time.monotonic() + int(args[3]) / 1000
+            return b"+OK\r\n"
+        if command == b"INCR":
+            value = int(self.lookup(args[0]) or 0) + 1
+            self.data[args[0]] = b"%d" % value
+            return b":%d\r\n" % value
+        if command == b"PEXPIRE":
+            self.expiry[args[0]] = time.monotonic() + int(args[1]) / 1000
+            return b":1\r\n"
+        if command == b"DEL":
+            self.expiry.pop(args[0], None)
+            return b":%d\r\n" % (self.data.pop(args[0], None) is not None)
+        return b"-ERR unknown command\r\n"
+
+
+async def read_command(reader):
+    header = await reader.readuntil(b"\r\n")
+    args = []
+    for _ in range(int(header[1:-2])):
+        length = await reader.readuntil(b"\r\n")
+        args.append((await reader.readexactly(int(length[1:-2]) + 2))[:-2])
+    return args
+
+
+def run(scenario):
+    async def main():
+        stand_in = StandIn()
+        port = await stand_in.start()
+        backend = my_bot.RedisBackend(f"redis://127.0.0.1:{port}", "test:", timeout=0.2)
+        try:
+            await scenario(stand_in, backend)
+        finally:
+            await backend.close()
+            await stand_in.stop()
+
+    asyncio.run(main())
+
+
+def test_get_set_incr_and_expiry():
+    async def scenario(stand_in, backend):
+        assert await backend.get("missing") is None
+        await backend.set("greeting", "hello", ttl=60)
+        assert await backend.get("greeting") == b"hello"
+
+        assert await backend.incr("hits", ttl=0.05) == 1
+        assert await backend.incr("hits", ttl=0.05) == 2
+        assert b"test:hits" in stand_in.expiry
+        await asyncio.sleep(0.06)
+        assert await backend.incr("hits", ttl=0.05) == 1
+
+        await backend.delete("greeting")
+        assert await backend.get("greeting") is None
+        assert stand_in.connections == 1
+
+    run(scenario)
+
+
+def test_late_reply_after_timeout_goes_to_the_caller_that_sent_it():
+    async def scenario(stand_in, backend):
+        await backend.set("slow", "late", ttl=60)
+        await backend.set("fast", "on time", ttl=60)
+        stand_in.delays[b"test:slow"] = 0.3
+
+        with pytest.raises(asyncio.TimeoutError):
+            await backend.get("slow")
+        assert await backend.get("fast") == b"on time"
+        assert await backend.get("slow") == b"late"
+        assert backend.errors == 1
+
+    run(scenario)
+
+
+def test_reconnects_after_server_drops_connection():
+    async def scenario(stand_in, backend):
+        await backend.set("key", "value", ttl=60)
+
+        stand_in.drop.add(b"test:key")
+        with pytest.raises(ConnectionError):
+            await backend.get("key")
+        assert await backend.get("key") == b"value"
+        assert stand_in.connections == 2
+
+        stand_in.disconnect_all()
+        await asyncio.sleep(0.01)
+        assert await backend.get("key") == b"value"
+        assert stand_in.connections == 3
+
+    run(scenario)